@@ -0,0 +1,52 @@
+# asset_bank.py
+# Process-wide sprite and sound bank (flyweight) shared by every enemy instance.
+# Surfaces and Sounds handed out here are shared; callers must copy before mutating them.
+import os
+import pygame
+
+ASSET_DIR = "assets"
+AUDIO_DIR = os.path.join(ASSET_DIR, "audio")
+
+_sprites = {}  # key = (name, size, flip)
+_sounds = {}  # key = name
+
+
+def get_sprite(name, size=None, flip=False):
+    key = (name, size, flip)
+    if key not in _sprites:
+        if flip:
+            image = pygame.transform.flip(get_sprite(name, size), True, False)
+        elif size:
+            image = pygame.transform.scale(get_sprite(name), size)
+        else:
+            image = pygame.image.load(os.path.join(ASSET_DIR, name)).convert_alpha()
+        _sprites[key] = image
+    return _sprites[key]
+
+
+def get_sound(name):
+    if name not in _sounds:
+        _sounds[name] = pygame.mixer.Sound(os.path.join(AUDIO_DIR, name))
+    return _sounds[name]
+
+
+def preload_enemy_assets(enemy_stats):
+    # Decode every enemy sprite (both facings) and sound up front so spawning never touches the disk
+    for stats in enemy_stats.values():
+        prefix = stats["prefix"]
+        size = (stats["height"], stats["width"])
+        for i in (1, 2):
+            for kind in ("walk", "death"):
+                get_sprite(f"{prefix}_{kind}{i}.png", size)
+                get_sprite(f"{prefix}_{kind}{i}.png", size, flip=True)
+            get_sound(f"{prefix}_death{i}.wav")
+    get_sound("pickup.wav")
+
+
+def clear():
+    _sprites.clear()
+    _sounds.clear()
+
+
+def get_stats():
+    return {"sprites": len(_sprites), "sounds": len(_sounds)}
@@ -0,0 +1,69 @@
+# benchmarks/blit_batching.py
+# Compares one screen.blit call per sprite against a single batched blits/fblits call per frame.
+# Run from the repo root: python benchmarks/blit_batching.py
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+WIDTH, HEIGHT = 1920, 1080
+SPRITE_COUNTS = [1000, 5000, 20000]
+FRAMES = 30
+
+
+def make_sprites(count):
+    # A handful of shared small surfaces, like the scaled world sprites the renderer reuses
+    rng = random.Random(0)
+    surfaces = []
+    for size in (8, 12, 16, 24):
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        surf.fill((rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 200))
+        surfaces.append(surf)
+    return [(rng.choice(surfaces), (rng.randint(0, WIDTH), rng.randint(0, HEIGHT))) for _ in range(count)]
+
+
+def per_sprite(screen, batch):
+    for surf, dest in batch:
+        screen.blit(surf, dest)
+
+
+def batched_blits(screen, batch):
+    screen.blits(batch, doreturn=False)
+
+
+def batched_fblits(screen, batch):
+    screen.fblits(batch)
+
+
+def time_frames(fn, screen, batch):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill((0, 0, 0))
+        fn(screen, batch)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    methods = [("blit loop", per_sprite), ("blits", batched_blits)]
+    if hasattr(screen, "fblits"):
+        methods.append(("fblits", batched_fblits))
+    else:
+        print("fblits not available in this pygame build, skipping")
+
+    print(f"{'sprites':>8} " + " ".join(f"{name:>12}" for name, _ in methods) + "   (ms/frame)")
+    for count in SPRITE_COUNTS:
+        batch = make_sprites(count)
+        results = [time_frames(fn, screen, batch) for _, fn in methods]
+        print(f"{count:>8} " + " ".join(f"{ms:>12.2f}" for ms in results))
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
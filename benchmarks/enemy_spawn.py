@@ -0,0 +1,45 @@
+# benchmarks/enemy_spawn.py
+# Spawn cost of Goblin/Orc waves with a cold asset bank (every constructor decodes its own PNGs and
+# WAVs, as before the bank existed) versus a preloaded, shared bank.
+# Run from the repo root: python benchmarks/enemy_spawn.py
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((1, 1))
+
+import asset_bank
+from entity import ENEMY_STATS, Goblin, Orc
+
+WAVE_SIZES = [10, 100]
+
+
+def spawn_wave(size, cold):
+    start = time.perf_counter()
+    for i in range(size):
+        if cold:
+            asset_bank.clear()
+        (Goblin if i % 2 else Orc)(0, 0)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'wave':>6} {'per-instance loads':>20} {'shared bank':>14}   (ms per wave)")
+    for size in WAVE_SIZES:
+        cold = spawn_wave(size, cold=True)
+        asset_bank.clear()
+        asset_bank.preload_enemy_assets(ENEMY_STATS)
+        warm = spawn_wave(size, cold=False)
+        print(f"{size:>6} {cold:>20.2f} {warm:>14.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
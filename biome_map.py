@@ -3,7 +3,14 @@
 import os
 import json
 import random
+import threading
 import pygame
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from hash_rng import hash_float, hash_int, stream_draw, stream_key
+from sprite_registry import sprite_id, sprite_name
 from structure_loader import load_prefab, place_prefab
 
 ROCK_HITBOX_PATH = os.path.join("assets", "data", "rock_hitboxes.json")
@@ -27,6 +34,7 @@ BIOME_WEIGHTS = [
     ("grassland", 30),
     ("swamp", 15)
 ]
+BIOME_NAMES = [biome for biome, _ in BIOME_WEIGHTS]  # biome id -> name, as used by the batch field API
 
 BIOME_TILE_VARIANTS = {
     "woodland": ["woodland1.png", "woodland2.png", "woodland3.png"],
@@ -39,11 +47,24 @@ VARIANT_SCALE = 7
 STRUCTURE_CHANCE = 0.01
 TILE_SIZE = 150
 
+# === Generator ===
+# 1: per-tile random.Random(coord_seed(...)) streams, the original world layout.
+# 2: counter-based hash RNG (hash_rng) keyed by (WORLD_SEED, tx, ty, salt, draw index); a different
+#    layout, but much cheaper per tile and the same on every run for a given WORLD_SEED. Needs numpy.
+GENERATOR_VERSION = 1
+WORLD_SEED = 0
+SALT_BIOME = 1
+SALT_VARIANT = 2
+SALT_DECORATION = 3
+
+# Region memo: biome ids per BIOME_SCALE cell and variant indices per VARIANT_SCALE cell
+REGION_CACHE_MAX = 4096
+REGION_CACHE_EVICT_FRACTION = 0.25  # farthest quarter is dropped when full, so eviction is amortised
+
 # === Internal State ===
 _loaded_prefabs = {}
 _structure_tiles = set()
 _structure_locations = set()
-_tree_colliders, _rock_colliders = [], []
 
 def coord_seed(x, y, salt=0):
     return (x * 3042161) ^ (y * 506683) ^ salt
@@ -61,31 +82,151 @@ def calculate_biome_asset_hitbox(x, y, size, cfg):
 
     return pygame.Rect(hitbox_x, hitbox_y, collision_width, collision_height)
 
-def get_biome_at(tx, ty):
-    rx = tx // BIOME_SCALE
-    ry = ty // BIOME_SCALE
-    seed = coord_seed(rx, ry, salt=1)
-    rng = random.Random(seed)
-    r = rng.uniform(0, 100)
+def _biome_id_for_region(rx, ry):
+    if GENERATOR_VERSION >= 2:
+        r = hash_float(WORLD_SEED, rx, ry, SALT_BIOME) * 100
+    else:
+        r = random.Random(coord_seed(rx, ry, salt=1)).uniform(0, 100)
     cumulative = 0
-    for biome, weight in BIOME_WEIGHTS:
+    for i, (_, weight) in enumerate(BIOME_WEIGHTS):
         cumulative += weight
         if r < cumulative:
-            return biome
-    return BIOME_WEIGHTS[-1][0]
+            return i
+    return len(BIOME_WEIGHTS) - 1
+
+
+def _variant_for_cell(rx, ry, count):
+    if GENERATOR_VERSION >= 2:
+        return hash_int(WORLD_SEED, rx, ry, SALT_VARIANT, 0, 0, count - 1)
+    return random.Random(coord_seed(rx, ry, salt=1)).randint(0, count - 1)
+
+
+# === Region cache ===
+# Biome ids and variant indices only depend on the cell a tile falls in, so they are memoised per cell.
+# Keys are (generator version, cell scale, variant count or 0 for biomes, rx, ry). Shared by the main
+# thread and the chunk workers; when full, the cells farthest from the player are evicted first.
+_region_cache = {}
+_region_cache_lock = threading.Lock()
+_region_cache_center = (0, 0)  # player tile position, see set_region_cache_center
+_region_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def set_region_cache_center(tx, ty):
+    global _region_cache_center
+    _region_cache_center = (tx, ty)
+
+
+def _evict_far_regions():
+    # Caller holds _region_cache_lock
+    cx, cy = _region_cache_center
+
+    def distance(key):
+        _, scale, _, rx, ry = key
+        return abs((rx + 0.5) * scale - cx) + abs((ry + 0.5) * scale - cy)
+
+    keys = sorted(_region_cache, key=distance, reverse=True)
+    for key in keys[:max(1, int(len(keys) * REGION_CACHE_EVICT_FRACTION))]:
+        del _region_cache[key]
+        _region_cache_stats["evictions"] += 1
+
+
+def _cached_region(scale, count, rx, ry):
+    key = (GENERATOR_VERSION, scale, count, rx, ry)
+    with _region_cache_lock:
+        value = _region_cache.get(key)
+        if value is not None:
+            _region_cache_stats["hits"] += 1
+            return value
+        _region_cache_stats["misses"] += 1
+    # Computed outside the lock; two threads racing on the same cell just store the same value
+    value = _variant_for_cell(rx, ry, count) if count else _biome_id_for_region(rx, ry)
+    with _region_cache_lock:
+        if len(_region_cache) >= REGION_CACHE_MAX:
+            _evict_far_regions()
+        _region_cache[key] = value
+    return value
+
+
+def _cached_biome_id(rx, ry):
+    return _cached_region(BIOME_SCALE, 0, rx, ry)
+
+
+def _cached_variant(rx, ry, count):
+    return _cached_region(VARIANT_SCALE, count, rx, ry)
+
+
+def get_region_cache_stats():
+    with _region_cache_lock:
+        lookups = _region_cache_stats["hits"] + _region_cache_stats["misses"]
+        return dict(_region_cache_stats, size=len(_region_cache),
+                    hit_rate=_region_cache_stats["hits"] / lookups if lookups else 0.0)
+
+
+def clear_region_cache():
+    with _region_cache_lock:
+        _region_cache.clear()
+
+
+def get_biome_at(tx, ty):
+    return BIOME_NAMES[_cached_biome_id(tx // BIOME_SCALE, ty // BIOME_SCALE)]
+
+
+def get_tile_variant(tx, ty, biome):
+    return _cached_variant(tx // VARIANT_SCALE, ty // VARIANT_SCALE, len(BIOME_TILE_VARIANTS[biome]))
 
 
 def get_tile_for_biome(tx, ty, biome, load_image_fn):
-    rx = tx // VARIANT_SCALE
-    ry = ty // VARIANT_SCALE
-    seed = coord_seed(rx, ry, salt=1)
-    rng = random.Random(seed)
-    variant_list = BIOME_TILE_VARIANTS[biome]
-    index = rng.randint(0, len(variant_list) - 1)
-    tile_name = variant_list[index]
+    tile_name = BIOME_TILE_VARIANTS[biome][get_tile_variant(tx, ty, biome)]
     return load_image_fn(tile_name)
 
 
+# === Batch field API ===
+# Biome ids and tile variant indices for a whole tile rectangle, identical to get_biome_at /
+# get_tile_variant per tile. Both only depend on the BIOME_SCALE / VARIANT_SCALE cell a tile falls in,
+# so each cell the rectangle touches is evaluated once and the results are broadcast to its tiles
+# (a 5x5 chunk touches at most 2x2 cells of each). Fields are indexed [dx][dy] from (tx0, ty0).
+
+def _cell_table(tx0, ty0, width, height, scale, fn):
+    # fn(rx, ry) for every cell under the rectangle, plus each tile's cell offset along x and y
+    cells_x = [(tx0 + dx) // scale for dx in range(width)]
+    cells_y = [(ty0 + dy) // scale for dy in range(height)]
+    rx0, ry0 = cells_x[0], cells_y[0]
+    table = [[fn(rx, ry) for ry in range(ry0, cells_y[-1] + 1)] for rx in range(rx0, cells_x[-1] + 1)]
+    return table, [rx - rx0 for rx in cells_x], [ry - ry0 for ry in cells_y]
+
+
+def get_biome_field(tx0, ty0, width, height):
+    table, off_x, off_y = _cell_table(tx0, ty0, width, height, BIOME_SCALE, _cached_biome_id)
+    if np is None:
+        return [[table[ox][oy] for oy in off_y] for ox in off_x]
+    return np.array(table, dtype=np.uint8)[np.array(off_x)[:, None], np.array(off_y)[None, :]]
+
+
+def get_variant_field(tx0, ty0, width, height, biome_field=None):
+    if biome_field is None:
+        biome_field = get_biome_field(tx0, ty0, width, height)
+    counts = [len(BIOME_TILE_VARIANTS[name]) for name in BIOME_NAMES]
+    tables = {}
+    for count in set(counts):
+        tables[count] = _cell_table(tx0, ty0, width, height, VARIANT_SCALE,
+                                    lambda rx, ry: _cached_variant(rx, ry, count))
+    if np is None:
+        field = []
+        for dx in range(width):
+            column = []
+            for dy in range(height):
+                table, off_x, off_y = tables[counts[biome_field[dx][dy]]]
+                column.append(table[off_x[dx]][off_y[dy]])
+            field.append(column)
+        return field
+    count_field = np.array(counts, dtype=np.uint8)[biome_field]
+    field = np.zeros((width, height), dtype=np.uint8)
+    for count, (table, off_x, off_y) in tables.items():
+        values = np.array(table, dtype=np.uint8)[np.array(off_x)[:, None], np.array(off_y)[None, :]]
+        np.copyto(field, values, where=count_field == count)
+    return field
+
+
 # Structure generation (currently disabled)
 # def try_place_structure(tx, ty, biome, placed_assets):
 #     seed = hash(("structure", tx, ty))
@@ -110,10 +251,21 @@ def get_tile_for_biome(tx, ty, biome, load_image_fn):
 #                 _structure_tiles.add((tx + dx, ty + dy))
 
 
-def spawn_natural_assets(tx, ty, biome, placed_assets):
+def spawn_natural_assets(tx, ty, biome, placed_assets, tree_colliders=None, rock_colliders=None):
+    # Collider rects go into the caller's lists (the owning chunk's), not module state
     if (tx, ty) in _structure_tiles:
         return
 
+    if GENERATOR_VERSION >= 2:
+        table = spawn_chunk_decorations(tx, ty, 1, 1, [[BIOME_NAMES.index(biome)]])
+        placed_assets.extend(table.to_objects())
+        trees, rocks = decoration_colliders(table)
+        if tree_colliders is not None:
+            tree_colliders.extend(trees)
+        if rock_colliders is not None:
+            rock_colliders.extend(rocks)
+        return
+
     rng = random.Random(coord_seed(tx, ty, salt=3))
     world_x = tx * TILE_SIZE
     world_y = ty * TILE_SIZE
@@ -128,7 +280,7 @@ def spawn_natural_assets(tx, ty, biome, placed_assets):
         tree = "tree_dead.png"
 
     if tree_spawn:
-        scale = 0.9 + 0.2 * random.random()
+        scale = 0.9 + 0.2 * random.random()  # global RNG: v1 tree sizes differ between runs
         size = int(scale * 140)
         jitter_x = rng.randint(-TILE_SIZE // 3, TILE_SIZE // 3)
         jitter_y = rng.randint(-TILE_SIZE // 3, TILE_SIZE // 3)
@@ -140,10 +292,10 @@ def spawn_natural_assets(tx, ty, biome, placed_assets):
             "scale_y": scale,
             "has_collision": True
         })
-        if tree in TREE_HITBOX_CONFIGS:
+        if tree in TREE_HITBOX_CONFIGS and tree_colliders is not None:
             cfg = TREE_HITBOX_CONFIGS[tree]
             rect = calculate_biome_asset_hitbox(world_x + jitter_x, world_y + jitter_y, size, cfg)
-            _tree_colliders.append(rect)
+            tree_colliders.append(rect)
 
         # tree spawns grass
         for _ in range(rng.randint(3, 4)):
@@ -153,7 +305,8 @@ def spawn_natural_assets(tx, ty, biome, placed_assets):
                 "x": world_x + jitter_y,
                 "y": world_y + jitter_x,
                 "scale_x": 0.3,
-                "scale_y": 0.3
+                "scale_y": 0.3,
+                "flat": True
             })
 
     # Shrubs
@@ -181,13 +334,13 @@ def spawn_natural_assets(tx, ty, biome, placed_assets):
             "scale_y": 0.35,
             "has_collision": True
         })
-        if rock in ROCK_HITBOX_CONFIGS:
+        if rock in ROCK_HITBOX_CONFIGS and rock_colliders is not None:
             base_size = 140  # consistent with visualizer
             scale = 0.35
             size = int(base_size * scale)
             cfg = ROCK_HITBOX_CONFIGS[rock]
             rect = calculate_biome_asset_hitbox(world_x + jitter_x, world_y + jitter_y, size, cfg)
-            _rock_colliders.append(rect)
+            rock_colliders.append(rect)
 
     # Grass
     if rng.random() < (0.333 if biome == "woodland" else 0.666):
@@ -197,16 +350,182 @@ def spawn_natural_assets(tx, ty, biome, placed_assets):
             "x": world_x + rng.randint(-TILE_SIZE // 2, TILE_SIZE // 2),
             "y": world_y + rng.randint(-TILE_SIZE // 2, TILE_SIZE // 2),
             "scale_x": 0.25,
-            "scale_y": 0.25
+            "scale_y": 0.25,
+            "flat": True
         })
 
 
-def draw_ground(screen, camera_x, camera_y, tile_size, load_image_fn, placed_assets, specific_tile=None):
+# === Batch decoration spawning ===
+# Decorations for a whole tile rectangle, returned as a DecorationTable. Under generator v2 (NumPy only)
+# every roll, choice, jitter and scale is a fixed draw slot of the tile's hash stream, so all tiles are
+# decided in a few vectorized passes and a tile's decorations don't depend on the rectangle it was
+# spawned with. v1 streams are sequential Mersenne Twister draws, so v1 still spawns tile by tile.
+
+_GREEN_TREES = [sprite_id(name) for name in ("tree_basic_green1.png", "tree_basic_green2.png", "tree_basic_green3.png")]
+_DEAD_TREE = sprite_id("tree_dead.png")
+_GRASSES = [sprite_id(name) for name in ("grass_green1.png", "grass_green2.png", "grass_green3.png")]
+_BUSHES = [sprite_id(name) for name in ("bush_green1.png", "bush_green2.png", "bush_green_red_berry1.png")]
+_ROCKS = [sprite_id(name) for name in ("rock_small1.png", "rock_small2.png", "rock_medium1.png", "rock_medium2.png")]
+
+DECOR_COLLISION = 1
+DECOR_FLAT = 2
+DECOR_TREE = 4
+DECOR_ROCK = 8
+
+TREE_BASE_SIZE = 140
+ROCK_SCALE = 0.35
+
+# Draw slots of a tile's decoration stream (generator v2)
+(_D_TREE_ROLL, _D_TREE_KIND, _D_TREE_SCALE, _D_TREE_JX, _D_TREE_JY, _D_TREE_GRASS_COUNT,
+ _D_TREE_GRASS, _, _, _,
+ _D_SHRUB_ROLL, _D_SHRUB_KIND, _D_SHRUB_SCALE, _D_SHRUB_X, _D_SHRUB_Y,
+ _D_ROCK_ROLL, _D_ROCK_KIND, _D_ROCK_X, _D_ROCK_Y,
+ _D_GRASS_ROLL, _D_GRASS_KIND, _D_GRASS_X, _D_GRASS_Y, DRAWS_PER_TILE) = range(24)
+_MAX_TREE_GRASS = 4
+
+
+class DecorationTable:
+    # Column-oriented decorations: sprite_registry id, world x/y, uniform scale and
+    # DECOR_* flags, one entry per placed object (NumPy arrays when available, lists otherwise)
+    __slots__ = ("sprite", "x", "y", "scale", "flags")
+
+    def __init__(self, sprite, x, y, scale, flags):
+        if np is not None:
+            sprite = np.asarray(sprite, dtype=np.int16)
+            x = np.asarray(x, dtype=np.int32)
+            y = np.asarray(y, dtype=np.int32)
+            scale = np.asarray(scale, dtype=np.float64)
+            flags = np.asarray(flags, dtype=np.uint8)
+        self.sprite, self.x, self.y, self.scale, self.flags = sprite, x, y, scale, flags
+
+    def __len__(self):
+        return len(self.sprite)
+
+    def rows(self):
+        columns = (self.sprite, self.x, self.y, self.scale, self.flags)
+        if np is not None:
+            columns = [column.tolist() for column in columns]
+        return zip(*columns)
+
+    def to_objects(self):
+        # Placed-object dicts in the format spawn_natural_assets produces
+        objects = []
+        for sprite, x, y, scale, flags in self.rows():
+            obj = {"filename": sprite_name(sprite), "x": x, "y": y, "scale_x": scale, "scale_y": scale}
+            if flags & DECOR_COLLISION:
+                obj["has_collision"] = True
+            if flags & DECOR_FLAT:
+                obj["flat"] = True
+            objects.append(obj)
+        return objects
+
+
+def _table_from_objects(objects):
+    columns = ([], [], [], [], [])
+    for obj in objects:
+        sprite = sprite_id(obj["filename"])
+        flags = (DECOR_COLLISION if obj.get("has_collision") else 0) | (DECOR_FLAT if obj.get("flat") else 0)
+        if sprite in _GREEN_TREES or sprite == _DEAD_TREE:
+            flags |= DECOR_TREE
+        elif sprite in _ROCKS:
+            flags |= DECOR_ROCK
+        for column, value in zip(columns, (sprite, obj["x"], obj["y"], obj["scale_x"], flags)):
+            column.append(value)
+    return DecorationTable(*columns)
+
+
+def decoration_colliders(table):
+    # Tree and rock collider rects for a table, sized as spawn_natural_assets sizes them
+    trees, rocks = [], []
+    for sprite, x, y, scale, flags in table.rows():
+        name = sprite_name(sprite)
+        if flags & DECOR_TREE and name in TREE_HITBOX_CONFIGS:
+            trees.append(calculate_biome_asset_hitbox(x, y, int(scale * TREE_BASE_SIZE), TREE_HITBOX_CONFIGS[name]))
+        elif flags & DECOR_ROCK and name in ROCK_HITBOX_CONFIGS:
+            rocks.append(calculate_biome_asset_hitbox(x, y, int(TREE_BASE_SIZE * ROCK_SCALE), ROCK_HITBOX_CONFIGS[name]))
+    return trees, rocks
+
+
+def _spawn_decorations_v2(tx0, ty0, width, height, biome_field):
+    # Tiles flattened in [dx][dy] order; draws[i, slot] is draw `slot` of tile i's decoration stream
+    tx = np.repeat(np.arange(tx0, tx0 + width), height)
+    ty = np.tile(np.arange(ty0, ty0 + height), width)
+    biome = np.asarray(biome_field, dtype=np.uint8).reshape(-1)
+    keys = stream_key(WORLD_SEED, tx, ty, SALT_DECORATION)
+    draws = stream_draw(keys[:, None], np.arange(DRAWS_PER_TILE)[None, :])
+    rolls = (draws >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def pick(slot, ids):
+        return np.asarray(ids, dtype=np.int16)[(draws[:, slot] % np.uint64(len(ids))).astype(np.intp)]
+
+    def jitter(slot, radius):
+        return (draws[:, slot] % np.uint64(2 * radius + 1)).astype(np.int32) - radius
+
+    woodland = biome == BIOME_NAMES.index("woodland")
+    grassland = biome == BIOME_NAMES.index("grassland")
+    swamp = biome == BIOME_NAMES.index("swamp")
+    world_x = (tx * TILE_SIZE).astype(np.int32)
+    world_y = (ty * TILE_SIZE).astype(np.int32)
+    third, half = TILE_SIZE // 3, TILE_SIZE // 2
+    parts = []  # (mask, sprite, x, y, scale, flags) per kind of decoration
+
+    tree = (woodland & (rolls[:, _D_TREE_ROLL] < 0.222)) | (swamp & (rolls[:, _D_TREE_ROLL] < 0.133))
+    tree_jx, tree_jy = jitter(_D_TREE_JX, third), jitter(_D_TREE_JY, third)
+    tree_sprite = np.where(woodland, pick(_D_TREE_KIND, _GREEN_TREES), _DEAD_TREE)
+    parts.append((tree, tree_sprite, world_x + tree_jx, world_y + tree_jy,
+                  0.9 + 0.2 * rolls[:, _D_TREE_SCALE], DECOR_COLLISION | DECOR_TREE))
+
+    # Trees spawn 3-4 grass tufts at their transposed jitter offset, like spawn_natural_assets
+    grass_count = 3 + (draws[:, _D_TREE_GRASS_COUNT] % np.uint64(2)).astype(np.int32)
+    for k in range(_MAX_TREE_GRASS):
+        parts.append((tree & (k < grass_count), pick(_D_TREE_GRASS + k, _GRASSES),
+                      world_x + tree_jy, world_y + tree_jx, 0.3, DECOR_FLAT))
+
+    shrub = (woodland & (rolls[:, _D_SHRUB_ROLL] < 0.33)) | (grassland & (rolls[:, _D_SHRUB_ROLL] < 0.02))
+    parts.append((shrub, pick(_D_SHRUB_KIND, _BUSHES), world_x + jitter(_D_SHRUB_X, half),
+                  world_y + jitter(_D_SHRUB_Y, half), 0.25 + 0.15 * rolls[:, _D_SHRUB_SCALE], 0))
+
+    parts.append((rolls[:, _D_ROCK_ROLL] < 0.03, pick(_D_ROCK_KIND, _ROCKS), world_x + jitter(_D_ROCK_X, half),
+                  world_y + jitter(_D_ROCK_Y, half), ROCK_SCALE, DECOR_COLLISION | DECOR_ROCK))
+
+    grass = rolls[:, _D_GRASS_ROLL] < np.where(woodland, 0.333, 0.666)
+    parts.append((grass, pick(_D_GRASS_KIND, _GRASSES), world_x + jitter(_D_GRASS_X, half),
+                  world_y + jitter(_D_GRASS_Y, half), 0.25, DECOR_FLAT))
+
+    if _structure_tiles:
+        free = np.array([(x, y) not in _structure_tiles for x, y in zip(tx.tolist(), ty.tolist())])
+        parts = [(mask & free,) + tuple(values) for mask, *values in parts]
+
+    counts = [int(np.count_nonzero(mask)) for mask, *_ in parts]
+    sprite = np.concatenate([part_sprite[mask] for mask, part_sprite, *_ in parts])
+    x = np.concatenate([part_x[mask] for mask, _, part_x, *_ in parts])
+    y = np.concatenate([part_y[mask] for mask, _, _, part_y, *_ in parts])
+    scale = np.concatenate([part_scale[mask] if isinstance(part_scale, np.ndarray) else np.full(n, part_scale)
+                            for (mask, _, _, _, part_scale, _), n in zip(parts, counts)])
+    flags = np.repeat(np.array([part[5] for part in parts], dtype=np.uint8), counts)
+    return DecorationTable(sprite, x, y, scale, flags)
+
+
+def spawn_chunk_decorations(tx0, ty0, width, height, biome_field):
+    # biome_field is indexed [dx][dy] like get_biome_field's output
+    if GENERATOR_VERSION >= 2:
+        if np is None:
+            raise ImportError("GENERATOR_VERSION 2 decorations require numpy")
+        return _spawn_decorations_v2(tx0, ty0, width, height, biome_field)
+    objects = []
+    for dx in range(width):
+        for dy in range(height):
+            spawn_natural_assets(tx0 + dx, ty0 + dy, BIOME_NAMES[biome_field[dx][dy]], objects)
+    return _table_from_objects(objects)
+
+
+def draw_ground(screen, camera_x, camera_y, tile_size, load_image_fn, placed_assets, specific_tile=None,
+                tree_colliders=None, rock_colliders=None):
     if specific_tile:
         tx, ty = specific_tile
         biome = get_biome_at(tx, ty)
         # try_place_structure(tx, ty, biome, placed_assets)  # Disabled
-        spawn_natural_assets(tx, ty, biome, placed_assets)
+        spawn_natural_assets(tx, ty, biome, placed_assets, tree_colliders, rock_colliders)
         return
 
     screen_width, screen_height = screen.get_size()
@@ -223,7 +542,4 @@ def draw_ground(screen, camera_x, camera_y, tile_size, load_image_fn, placed_ass
             offset_y = (tx + ty) * (TILE_SIZE // 4)
             screen.blit(tile_img, (offset_x - camera_x, offset_y - camera_y))
             # try_place_structure(tx, ty, biome, placed_assets)  # Disabled
-            spawn_natural_assets(tx, ty, biome, placed_assets)
-
-def get_biome_map_colliders():
-    return _tree_colliders, _rock_colliders
+            spawn_natural_assets(tx, ty, biome, placed_assets, tree_colliders, rock_colliders)
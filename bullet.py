@@ -3,6 +3,7 @@ import pygame
 import math
 import os
 import json
+from pool import ObjectPool
 
 ASSET_DIR = "assets"
 DATA_DIR = os.path.join(ASSET_DIR, "data")
@@ -15,14 +16,50 @@ if os.path.exists(BULLET_CONFIG_PATH):
 else:
     BULLET_CONFIGS = {}
 
+# Bullet lifecycle limits
+BULLET_MAX_RANGE = 1500  # px travelled before a bullet expires
+BULLET_LIFETIME = 180  # frames (3s at 60 FPS) before a bullet expires
+MAX_BULLETS = 300  # hard cap on live projectiles; firing is refused above it
+
+# Bullets are drawn pre-rotated to one of ANGLE_BUCKETS directions; 32 covers the 8 firing
+# directions exactly and leaves room for a fixed-frame spin animation
+ANGLE_BUCKETS = 32
+
+# Shared bullet surfaces: key = sprite_name for the scaled base, (sprite_name, bucket) for rotated frames
+_scaled_sprites = {}
+_rotated_frames = {}
+
+def get_scaled_sprite(sprite, sprite_name):
+    if sprite_name not in _scaled_sprites:
+        cfg = BULLET_CONFIGS[sprite_name]
+        scaled_width = int(sprite.get_width() * cfg["bullet_scale_x"])
+        scaled_height = int(sprite.get_height() * cfg["bullet_scale_y"])
+        _scaled_sprites[sprite_name] = pygame.transform.scale(sprite, (scaled_width, scaled_height))
+    return _scaled_sprites[sprite_name]
+
+def angle_bucket(angle):
+    return round(angle / (2 * math.pi) * ANGLE_BUCKETS) % ANGLE_BUCKETS
+
+def get_bucket_frame(sprite, sprite_name, bucket):
+    key = (sprite_name, bucket)
+    if key not in _rotated_frames:
+        degrees = bucket * 360 / ANGLE_BUCKETS
+        _rotated_frames[key] = pygame.transform.rotate(get_scaled_sprite(sprite, sprite_name), -degrees)
+    return _rotated_frames[key]
+
+def get_rotated_frame(sprite, sprite_name, angle):
+    return get_bucket_frame(sprite, sprite_name, angle_bucket(angle))
+
 class Bullet:
-    def __init__(self, x, y, angle, speed, damage, sprite, x_off=0, y_off=0, facing_left=False, scale_x=1.0, scale_y=1.0, sprite_name=None):
-        # Scale the sprite
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def reset(self, x, y, angle, speed, damage, sprite, x_off=0, y_off=0, facing_left=False, scale_x=1.0, scale_y=1.0, sprite_name=None,
+              max_range=BULLET_MAX_RANGE, lifetime=BULLET_LIFETIME):
+        # Scaled and rotated surfaces are shared by every bullet of this sprite
         original_width = sprite.get_width()
-        original_height = sprite.get_height()
-        scaled_width = int(original_width * BULLET_CONFIGS[sprite_name]["bullet_scale_x"])
-        scaled_height = int(original_height * BULLET_CONFIGS[sprite_name]["bullet_scale_y"])
-        self.sprite = pygame.transform.scale(sprite, (scaled_width, scaled_height))
+        self.sprite = get_scaled_sprite(sprite, sprite_name)
+        self.frame = get_rotated_frame(sprite, sprite_name, angle)
         self.hit  = False
 
         # Set initial position
@@ -41,12 +78,39 @@ class Bullet:
         self.dx = math.cos(angle) * speed
         self.dy = math.sin(angle) * speed
 
-    def update(self):
+        self.age = 0
+        self.distance = 0
+        self.max_range = max_range
+        self.lifetime = lifetime
+
+    def update(self, bounds=None):
+        # Returns True once the bullet has expired and should be removed
         self.x += self.dx
         self.y += self.dy
+        self.age += 1
+        self.distance += self.speed
+        if self.hit or self.age >= self.lifetime or self.distance >= self.max_range:
+            return True
+        return bounds is not None and not bounds.collidepoint(self.x, self.y)
 
     def get_position(self):
         return self.x, self.y
 
     def get_hitbox(self):
-        return pygame.Rect(self.x, self.y, self.sprite.get_width(), self.sprite.get_height())
+        return pygame.Rect(self.get_hitbox_bounds())
+
+    def get_hitbox_bounds(self):
+        return self.x, self.y, self.sprite.get_width(), self.sprite.get_height()
+
+
+bullet_pool = ObjectPool(Bullet)
+
+def update_bullets(bullets, bounds=None):
+    # Advance all bullets and keep only the live ones; expired bullets go back to bullet_pool
+    live = []
+    for b in bullets:
+        if b.update(bounds):
+            bullet_pool.release(b)
+        else:
+            live.append(b)
+    return live
@@ -0,0 +1,187 @@
+# bullet_system.py
+# Opt-in projectile engine that keeps every bullet in NumPy arrays instead of one Bullet object each.
+# Positions, expiry and hit tests run as single vectorized passes, which lets rapid-fire attacks and
+# bullet-hell waves scale to thousands of projectiles.
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; main.py falls back to the Bullet list when it is missing
+    np = None
+
+from bullet import (BULLET_CONFIGS, BULLET_MAX_RANGE, BULLET_LIFETIME,
+                    angle_bucket, get_scaled_sprite, get_bucket_frame)
+
+NUMPY_AVAILABLE = np is not None
+BULLET_SYSTEM_CAPACITY = 4096  # replaces MAX_BULLETS as the projectile cap when this engine is used
+HIT_TEST_CELL_SIZE = 128  # grid cell size for hit_test's broadphase, same as combat.HIT_GRID_CELL_SIZE
+
+
+def _cell_key(cell_x, cell_y):
+    # Packs int64 cell coordinates into one sortable int64 key
+    return (cell_x << 32) | (cell_y & 0xFFFFFFFF)
+
+
+class BulletSystem:
+    def __init__(self, capacity=BULLET_SYSTEM_CAPACITY, max_range=BULLET_MAX_RANGE, lifetime=BULLET_LIFETIME):
+        if np is None:
+            raise ImportError("BulletSystem requires numpy")
+        self.capacity = capacity
+        self.max_range = max_range
+        self.lifetime = lifetime
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.dx = np.zeros(capacity, dtype=np.float64)
+        self.dy = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.distance = np.zeros(capacity, dtype=np.float64)
+        self.w = np.zeros(capacity, dtype=np.int32)  # hitbox size (scaled, unrotated sprite)
+        self.h = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int32)  # index into self._kinds
+        self.bucket = np.zeros(capacity, dtype=np.int32)  # rotated frame bucket
+        self.hit = np.zeros(capacity, dtype=bool)
+
+        self._kinds = []  # (sprite_name, sprite) per kind id
+        self._kind_ids = {}
+
+    def __len__(self):
+        return self.count
+
+    def _kind_id(self, sprite, sprite_name):
+        if sprite_name not in self._kind_ids:
+            self._kind_ids[sprite_name] = len(self._kinds)
+            self._kinds.append((sprite_name, sprite))
+        return self._kind_ids[sprite_name]
+
+    def spawn(self, x, y, angle, speed, damage, sprite, facing_left=False, sprite_name=None):
+        # Mirrors Bullet.__init__ placement; returns False when the system is full
+        if self.count >= self.capacity:
+            return False
+        cfg = BULLET_CONFIGS[sprite_name]
+        scaled = get_scaled_sprite(sprite, sprite_name)
+        if facing_left:
+            x = x + 2 * cfg["bullet_x_off"] - sprite.get_width()
+        else:
+            x = x + cfg["bullet_x_off"]
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y + cfg["bullet_y_off"]
+        self.dx[i] = math.cos(angle) * speed
+        self.dy[i] = math.sin(angle) * speed
+        self.speed[i] = speed
+        self.damage[i] = damage
+        self.age[i] = 0
+        self.distance[i] = 0
+        self.w[i], self.h[i] = scaled.get_size()
+        self.kind[i] = self._kind_id(sprite, sprite_name)
+        self.bucket[i] = angle_bucket(angle)
+        self.hit[i] = False
+        self.count += 1
+        return True
+
+    def update(self, bounds=None):
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+        self.age[:n] += 1
+        self.distance[:n] += self.speed[:n]
+
+        alive = ~self.hit[:n] & (self.age[:n] < self.lifetime) & (self.distance[:n] < self.max_range)
+        if bounds is not None:
+            alive &= ((self.x[:n] >= bounds.left) & (self.x[:n] < bounds.right) &
+                      (self.y[:n] >= bounds.top) & (self.y[:n] < bounds.bottom))
+        self._compact(alive)
+
+    def _compact(self, alive):
+        keep = np.flatnonzero(alive)
+        if len(keep) == self.count:
+            return
+        k = len(keep)
+        for arr in (self.x, self.y, self.dx, self.dy, self.speed, self.damage, self.age,
+                    self.distance, self.w, self.h, self.kind, self.bucket, self.hit):
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def hit_test(self, boxes, cell_size=HIT_TEST_CELL_SIZE):
+        # boxes: (M, 4) array of x, y, w, h target hitboxes. Pairs each live bullet with at most one
+        # overlapping target and flags those bullets as hit so the next update removes them; returns
+        # (bullet_idx, target_idx) arrays. Candidates come from a uniform grid binned in NumPy: each
+        # bullet sits in the cell of its top-left corner, each target in every cell its box covers once
+        # grown up/left by the largest bullet, so every overlapping pair shares exactly one cell.
+        n = self.count
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        empty = np.empty(0, dtype=np.intp)
+        live = np.flatnonzero(~self.hit[:n])
+        if not len(live) or not len(boxes):
+            return empty, empty
+
+        bx, by = self.x[live], self.y[live]
+        bw, bh = self.w[live], self.h[live]
+        tx, ty, tw, th = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+
+        # Target cell ranges, expanded into one (cell key, target) entry per covered cell
+        cx0 = np.floor_divide(tx - bw.max(), cell_size).astype(np.int64)
+        cy0 = np.floor_divide(ty - bh.max(), cell_size).astype(np.int64)
+        nx = np.floor_divide(tx + tw, cell_size).astype(np.int64) - cx0 + 1
+        ny = np.floor_divide(ty + th, cell_size).astype(np.int64) - cy0 + 1
+        per_target = nx * ny
+        target = np.repeat(np.arange(len(boxes)), per_target)
+        local = np.arange(len(target)) - np.repeat(np.cumsum(per_target) - per_target, per_target)
+        target_keys = _cell_key(cx0[target] + local % nx[target], cy0[target] + local // nx[target])
+        order = np.argsort(target_keys, kind="stable")
+        target, target_keys = target[order], target_keys[order]
+
+        # Join each bullet's cell against the sorted target entries
+        bullet_keys = _cell_key(np.floor_divide(bx, cell_size).astype(np.int64),
+                                np.floor_divide(by, cell_size).astype(np.int64))
+        start = np.searchsorted(target_keys, bullet_keys, side="left")
+        counts = np.searchsorted(target_keys, bullet_keys, side="right") - start
+        if not counts.any():
+            return empty, empty
+        pair_bullet = np.repeat(np.arange(len(live)), counts)
+        pair_entry = np.repeat(start, counts) + np.arange(len(pair_bullet)) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_target = target[pair_entry]
+
+        # Narrowphase, then keep the first overlapping target per bullet
+        b, t = pair_bullet, pair_target
+        overlap = (bx[b] < tx[t] + tw[t]) & (bx[b] + bw[b] > tx[t]) & (by[b] < ty[t] + th[t]) & (by[b] + bh[b] > ty[t])
+        b, t = b[overlap], t[overlap]
+        b, first = np.unique(b, return_index=True)
+        bullet_idx, target_idx = live[b], t[first]
+        self.hit[bullet_idx] = True
+        return bullet_idx, target_idx
+
+    def mark_hits(self, indices):
+        # Flags bullets as spent; the next update removes them
+        self.hit[np.asarray(indices, dtype=np.intp)] = True
+
+    def get_blits(self, camera_x, camera_y, width, height):
+        # Pull visible positions in bulk and return (surface, dest) pairs plus the culled count
+        n = self.count
+        if not n:
+            return [], 0
+        sx = self.x[:n] - camera_x
+        sy = self.y[:n] - camera_y
+        # Rotated frames are at most ~1.42x the sprite, so 2x its size is a safe culling extent
+        visible = np.flatnonzero((sx < width) & (sx + self.w[:n] * 2 > 0) & (sy < height) & (sy + self.h[:n] * 2 > 0))
+
+        blits = []
+        kinds, buckets = self.kind[visible].tolist(), self.bucket[visible].tolist()
+        for kind, bucket, px, py in zip(kinds, buckets, sx[visible].tolist(), sy[visible].tolist()):
+            sprite_name, sprite = self._kinds[kind]
+            blits.append((get_bucket_frame(sprite, sprite_name, bucket), (px, py)))
+        return blits, n - len(visible)
+
+    def get_hitboxes(self):
+        n = self.count
+        return np.stack([self.x[:n], self.y[:n], self.w[:n], self.h[:n]], axis=1)
+
+    def clear(self):
+        self.count = 0
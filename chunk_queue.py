@@ -0,0 +1,114 @@
+# chunk_queue.py
+# Priority request queue for chunk generation. Repeated requests for a chunk that is already queued or
+# being generated are coalesced, and requests for chunks that left the target window are cancelled.
+import heapq
+import itertools
+import threading
+import time
+
+# request() results; coalesced requests return False
+QUEUED = "queued"
+REPRIORITISED = "reprioritised"
+
+
+class ChunkRequestQueue:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []  # (priority, seq, chunk); stale entries are skipped lazily
+        self._pending = {}  # chunk -> (priority, seq, enqueue_time) for live entries
+        self._in_flight = set()
+        self._target = None  # chunks currently wanted; None = accept everything
+        self._seq = itertools.count()
+        self._closed = False
+
+        # Metrics
+        self.enqueued = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def request(self, chunk, priority=0):
+        # Queue a chunk (lower priority value = sooner). Returns QUEUED for a new request, REPRIORITISED
+        # when an already queued request moved up, and False if it was coalesced.
+        with self._cond:
+            if chunk in self._in_flight:
+                self.coalesced += 1
+                return False
+            entry = self._pending.get(chunk)
+            if entry is not None:
+                self.coalesced += 1
+                if priority >= entry[0]:
+                    return False
+                # Re-prioritise: push a fresher entry; the old one becomes stale
+                enqueue_time = entry[2]
+            else:
+                enqueue_time = time.perf_counter()
+                self.enqueued += 1
+            seq = next(self._seq)
+            self._pending[chunk] = (priority, seq, enqueue_time)
+            heapq.heappush(self._heap, (priority, seq, chunk))
+            self._cond.notify()
+            return REPRIORITISED if entry is not None else QUEUED
+
+    def retarget(self, target_chunks):
+        # Drop queued requests for chunks outside the new target window
+        with self._cond:
+            self._target = set(target_chunks)
+            for chunk in list(self._pending):
+                if chunk not in self._target:
+                    del self._pending[chunk]
+                    self.cancelled += 1
+
+    def is_wanted(self, chunk):
+        with self._cond:
+            return self._target is None or chunk in self._target
+
+    def get(self):
+        # Blocks until a request is available; returns None once the queue is closed
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                while self._heap:
+                    priority, seq, chunk = heapq.heappop(self._heap)
+                    entry = self._pending.get(chunk)
+                    if entry is None or entry[1] != seq:
+                        continue  # cancelled or superseded
+                    del self._pending[chunk]
+                    self._in_flight.add(chunk)
+                    wait = time.perf_counter() - entry[2]
+                    self.total_wait += wait
+                    self.max_wait = max(self.max_wait, wait)
+                    return chunk
+                self._cond.wait()
+
+    def done(self, chunk):
+        with self._cond:
+            self._in_flight.discard(chunk)
+            self.completed += 1
+
+    def outstanding(self):
+        # Requests that may still publish a chunk: queued plus being generated
+        with self._cond:
+            return len(self._pending) + len(self._in_flight)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_stats(self):
+        with self._cond:
+            dequeued = self.enqueued - self.cancelled - len(self._pending)
+            return {
+                "depth": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "enqueued": self.enqueued,
+                "coalesced": self.coalesced,
+                "cancelled": self.cancelled,
+                "completed": self.completed,
+                "avg_wait_ms": self.total_wait / dequeued * 1000 if dequeued else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+            }
@@ -0,0 +1,165 @@
+# chunk_store.py
+# Optional on-disk cache of generated chunk data (tile variants, decoration table, colliders), so
+# revisited chunks and repeat sessions skip world generation. One compact binary file per chunk under
+# a directory keyed by generator version and world seed; files are memory-mapped for reading and
+# written atomically (temp file + rename) by the chunk worker threads.
+#
+# File layout (little-endian):
+#   header   <4sHiiHHHHH  magic, format version, cx, cy, names, tiles, objects, tree rects, rock rects
+#   names    per name: <H length + UTF-8 filename (tile and sprite names used below, by index)
+#   tiles    uint16 name index per tile, [dx][dy] order
+#   objects  column blocks: uint16 name index, int32 x, int32 y, float64 scale, uint8 DECOR_* flags
+#   rects    int32 x, y, w, h per tree collider, then per rock collider
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+import pygame
+import biome_map
+from biome_map import DecorationTable
+from sprite_registry import sprite_id, sprite_name
+
+ENABLED = False  # main.USE_CHUNK_STORE turns this on
+STORE_DIR = os.path.join("assets", "data", "chunk_store")
+MAGIC = b"HGCK"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHiiHHHHH")
+_NAME_LEN = struct.Struct("<H")
+_SWAP = sys.byteorder != "little"  # array() uses native byte order
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "writes": 0, "errors": 0, "bytes_read": 0, "bytes_written": 0}
+
+
+class StoredChunk:
+    # Everything generate_chunk needs besides images: tile filenames in [dx][dy] order, the chunk's
+    # DecorationTable and its collider rects
+    __slots__ = ("tiles", "decorations", "tree_colliders", "rock_colliders")
+
+    def __init__(self, tiles, decorations, tree_colliders, rock_colliders):
+        self.tiles = tiles
+        self.decorations = decorations
+        self.tree_colliders = tree_colliders
+        self.rock_colliders = rock_colliders
+
+
+def _count(key, amount=1):
+    with _stats_lock:
+        _stats[key] += amount
+
+
+def store_path(cx, cy):
+    # Layouts differ per generator version and seed, so each pair gets its own directory
+    folder = f"gen{biome_map.GENERATOR_VERSION}_seed{biome_map.WORLD_SEED}"
+    return os.path.join(STORE_DIR, folder, f"{cx}_{cy}.chunk")
+
+
+def _pack_array(typecode, values):
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_array(typecode, buffer, offset, count):
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(buffer[offset:end])
+    if _SWAP:
+        values.byteswap()
+    return values, end
+
+
+def save(cx, cy, stored):
+    names = []
+    index = {}
+
+    def name_index(name):
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        return index[name]
+
+    table = stored.decorations
+    sprite, x, y, scale, flags = (list(column) for column in zip(*table.rows())) if len(table) else ([],) * 5
+    tile_indices = [name_index(name) for name in stored.tiles]
+    object_indices = [name_index(sprite_name(sid)) for sid in sprite]
+    rects = [value for rect in stored.tree_colliders + stored.rock_colliders for value in rect]
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, cx, cy, len(names), len(tile_indices), len(object_indices),
+                          len(stored.tree_colliders), len(stored.rock_colliders))]
+    for name in names:
+        encoded = name.encode("utf-8")
+        parts += [_NAME_LEN.pack(len(encoded)), encoded]
+    parts += [_pack_array("H", tile_indices), _pack_array("H", object_indices), _pack_array("i", x),
+              _pack_array("i", y), _pack_array("d", scale), _pack_array("B", flags), _pack_array("i", rects)]
+    data = b"".join(parts)
+
+    path = store_path(cx, cy)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        _count("errors")
+        return False
+    _count("writes")
+    _count("bytes_written", len(data))
+    return True
+
+
+def load(cx, cy):
+    # StoredChunk for (cx, cy), or None if it isn't stored (or the file is unreadable)
+    path = store_path(cx, cy)
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            stored = _parse(buffer, cx, cy)
+            size = len(buffer)
+    except FileNotFoundError:
+        _count("misses")
+        return None
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        _count("errors")
+        return None
+    _count("hits")
+    _count("bytes_read", size)
+    return stored
+
+
+def _parse(buffer, cx, cy):
+    magic, version, file_cx, file_cy, n_names, n_tiles, n_objects, n_trees, n_rocks = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != FORMAT_VERSION or (file_cx, file_cy) != (cx, cy):
+        raise ValueError(f"not a chunk file for {(cx, cy)}")
+    offset = _HEADER.size
+
+    names = []
+    for _ in range(n_names):
+        (length,) = _NAME_LEN.unpack_from(buffer, offset)
+        offset += _NAME_LEN.size
+        names.append(buffer[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    tile_indices, offset = _unpack_array("H", buffer, offset, n_tiles)
+    object_indices, offset = _unpack_array("H", buffer, offset, n_objects)
+    x, offset = _unpack_array("i", buffer, offset, n_objects)
+    y, offset = _unpack_array("i", buffer, offset, n_objects)
+    scale, offset = _unpack_array("d", buffer, offset, n_objects)
+    flags, offset = _unpack_array("B", buffer, offset, n_objects)
+    rect_values, offset = _unpack_array("i", buffer, offset, 4 * (n_trees + n_rocks))
+    if offset != len(buffer):
+        raise ValueError("truncated or oversized chunk file")
+
+    sprite_ids = {i: sprite_id(names[i]) for i in set(object_indices)}  # file name index -> this process's id
+    rects = [pygame.Rect(rect_values[i:i + 4]) for i in range(0, len(rect_values), 4)]
+    decorations = DecorationTable([sprite_ids[i] for i in object_indices], x, y, scale, flags)
+    return StoredChunk([names[i] for i in tile_indices], decorations, rects[:n_trees], rects[n_trees:])
+
+
+def get_stats():
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,51 @@
+# collision.py
+# Axis-separated, swept collision resolution against static world colliders.
+# Movement is resolved on X then Y; on each axis the entity is stopped flush against the nearest
+# collider in its path, so it slides along trees/rocks instead of sticking, and fast movers can't
+# tunnel through thin colliders. Each entity reuses one Rect (entity.sweep_rect) for broadphase queries.
+import math
+from world import query_static_colliders
+
+
+def _sweep_axis(entity, hx, hy, hw, hh, delta, axis):
+    # Returns how far the box (hx, hy, hw, hh) can travel `delta` along axis 0 (x) or 1 (y)
+    if not delta:
+        return 0
+    if axis == 0:
+        left, top = min(hx, hx + delta), hy
+        width, height = hw + abs(delta), hh
+    else:
+        left, top = hx, min(hy, hy + delta)
+        width, height = hw, hh + abs(delta)
+
+    sweep = entity.sweep_rect
+    sweep.update(math.floor(left), math.floor(top), math.ceil(width) + 1, math.ceil(height) + 1)
+
+    for c in query_static_colliders(sweep):
+        if axis == 0:
+            if not (c.top < hy + hh and hy < c.bottom):
+                continue
+            if delta > 0 and c.left >= hx + hw:
+                delta = min(delta, c.left - (hx + hw))
+            elif delta < 0 and c.right <= hx:
+                delta = max(delta, c.right - hx)
+        else:
+            if not (c.left < hx + hw and hx < c.right):
+                continue
+            if delta > 0 and c.top >= hy + hh:
+                delta = min(delta, c.top - (hy + hh))
+            elif delta < 0 and c.bottom <= hy:
+                delta = max(delta, c.bottom - hy)
+        # Colliders already overlapping the box are ignored so an entity can always move out of them
+    return delta
+
+
+def move_and_slide(entity, move_x, move_y):
+    # Moves entity (anything with x, y, sweep_rect and get_hitbox_bounds) by up to (move_x, move_y), sliding along
+    # colliders. Returns the distance actually moved on each axis.
+    hx, hy, hw, hh = entity.get_hitbox_bounds()
+    dx = _sweep_axis(entity, hx, hy, hw, hh, move_x, 0)
+    entity.x += dx
+    dy = _sweep_axis(entity, hx + dx, hy, hw, hh, move_y, 1)
+    entity.y += dy
+    return dx, dy
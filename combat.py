@@ -0,0 +1,69 @@
+# combat.py
+# Bullet-vs-enemy hit detection. Bullets, enemies and item drops go into a DynamicGrid each tick, so
+# only boxes sharing a cell are tested instead of every bullet against every enemy. When both sides are
+# NumPy engines (BulletSystem and EnemySwarm) the grid is binned in NumPy by BulletSystem.hit_test instead.
+from spatial_hash import DynamicGrid
+
+HIT_GRID_CELL_SIZE = 128
+
+hit_grid = DynamicGrid(HIT_GRID_CELL_SIZE)
+
+
+def _bullet_boxes(bullets):
+    # Works for both a list of Bullet objects and the NumPy BulletSystem
+    if hasattr(bullets, "get_hitboxes"):
+        return bullets.get_hitboxes().tolist()
+    return [b.get_hitbox_bounds() for b in bullets]
+
+
+def resolve_bullet_hits(bullets, enemies, grid=hit_grid):
+    # Each bullet damages at most one enemy; returns the number of hits this tick
+    if not len(bullets) or not len(enemies):
+        return 0
+    if hasattr(bullets, "hit_test") and hasattr(enemies, "get_hitboxes"):
+        hit_bullets, hit_enemies = bullets.hit_test(enemies.get_hitboxes())
+        enemies.take_damage(hit_enemies, bullets.damage[hit_bullets])
+        return len(hit_bullets)
+
+    grid.rebuild("bullets", _bullet_boxes(bullets))
+    if hasattr(enemies, "get_hitboxes"):
+        live = None
+        grid.rebuild("enemies", enemies.get_hitboxes().tolist())
+    else:
+        live = [e for e in enemies if not e.is_dead]
+        grid.rebuild("enemies", [e.get_hitbox_bounds() for e in live])
+
+    hit_bullets = []
+    hit_enemies = []
+    spent = set()
+    for ib, ie in grid.pairs("bullets", "enemies"):
+        if ib in spent:
+            continue
+        spent.add(ib)
+        hit_bullets.append(ib)
+        hit_enemies.append(ie)
+    if not hit_bullets:
+        return 0
+
+    if hasattr(bullets, "mark_hits"):
+        damages = bullets.damage[hit_bullets].tolist()
+        bullets.mark_hits(hit_bullets)
+    else:
+        damages = []
+        for ib in hit_bullets:
+            bullets[ib].hit = True
+            damages.append(bullets[ib].damage)
+
+    if live is None:
+        enemies.take_damage(hit_enemies, damages)
+    else:
+        for ie, damage in zip(hit_enemies, damages):
+            if not live[ie].is_dead:
+                live[ie].take_damage(damage)
+    return len(hit_bullets)
+
+
+def find_nearby_drops(item_drops, x, y, radius, grid=hit_grid):
+    # Indices of item drops within `radius` of (x, y) on either axis (pickup candidates)
+    grid.rebuild("drops", [(item.x, item.y, 1, 1) for item in item_drops])
+    return grid.query("drops", (x - radius, y - radius, 2 * radius, 2 * radius))
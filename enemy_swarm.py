@@ -0,0 +1,188 @@
+# enemy_swarm.py
+# Struct-of-arrays enemy engine: Goblin/Orc positions, speeds, health and animation state live in
+# contiguous NumPy arrays so a whole horde steps toward the player in one vectorized update.
+import random
+import pygame
+import asset_bank
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; main.py falls back to a plain enemy list when it is missing
+    np = None
+
+from entity import ENEMY_STATS, HITBOX_CONFIGS, death_animation_pool, roll_item_drop, update_death_animations
+from item_drop import item_drop_pool
+
+NUMPY_AVAILABLE = np is not None
+ANIMATION_INTERVAL = 10  # frames per walk frame, same as BaseEntity.update_animation
+
+
+class EnemyType:
+    # Stats, shared asset-bank frames and hitbox layout for every enemy of one type
+    def __init__(self, name):
+        stats = ENEMY_STATS[name]
+        prefix = stats["prefix"]
+        self.name = name
+        self.width, self.height = stats["width"], stats["height"]
+        self.health = stats["health"]
+        self.speed = stats["speed"]
+        self.damage = stats["damage"]
+
+        size = (self.height, self.width)
+        self.frames = [asset_bank.get_sprite(f"{prefix}_walk{i}.png", size) for i in (1, 2)]
+        self.flipped_frames = [asset_bank.get_sprite(f"{prefix}_walk{i}.png", size, flip=True) for i in (1, 2)]
+        self.death_frames = [asset_bank.get_sprite(f"{prefix}_death{i}.png", size) for i in (1, 2)]
+        self.death_sounds = [asset_bank.get_sound(f"{prefix}_death{i}.wav") for i in (1, 2)]
+        self.pickup_sound = asset_bank.get_sound("pickup.wav")
+
+        cfg = HITBOX_CONFIGS.get(name, {"w": 1.0, "h": 1.0, "x_off": 0.0, "y_off": 0.0})
+        self.hitbox_w = int(self.width * cfg["w"])
+        self.hitbox_h = int(self.height * cfg["h"])
+        self.hitbox_dx = int(self.width * cfg["x_off"])
+        self.hitbox_dy = -int(self.hitbox_h * (1 + cfg["y_off"]))
+
+
+class EnemySwarm:
+    def __init__(self, capacity=4096, type_names=("Goblin", "Orc")):
+        if np is None:
+            raise ImportError("EnemySwarm requires numpy")
+        self.capacity = capacity
+        self.count = 0
+        self.kills = 0
+        self.death_animations = []  # DeathAnimation objects for the renderer's dead_entities layer
+        self.item_drops = []  # drops rolled by kills since main.py last collected them
+
+        self.types = [EnemyType(name) for name in type_names]
+        self.type_ids = {t.name: i for i, t in enumerate(self.types)}
+        # Per-type lookups indexed by type id
+        self._width = np.array([t.width for t in self.types])
+        self._height = np.array([t.height for t in self.types])
+        self._frame_count = np.array([len(t.frames) for t in self.types])
+        self._hitbox = np.array([[t.hitbox_dx, t.hitbox_dy, t.hitbox_w, t.hitbox_h] for t in self.types], dtype=np.float64)
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.type_id = np.zeros(capacity, dtype=np.int32)
+        self.animation_index = np.zeros(capacity, dtype=np.int32)
+        self.animation_timer = np.zeros(capacity, dtype=np.int32)
+        self.facing_left = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, type_name, x, y):
+        if self.count >= self.capacity:
+            return False
+        tid = self.type_ids[type_name]
+        enemy_type = self.types[tid]
+        i = self.count
+        self.x[i], self.y[i] = x, y
+        self.speed[i] = enemy_type.speed
+        self.health[i] = enemy_type.health
+        self.damage[i] = enemy_type.damage
+        self.type_id[i] = tid
+        self.animation_index[i] = 0
+        self.animation_timer[i] = 0
+        self.facing_left[i] = False
+        self.count += 1
+        return True
+
+    def update(self, px, py):
+        # Vectorized Enemy.move_toward_player + BaseEntity.update_animation for every live enemy
+        n = self.count
+        if not n:
+            return
+        dx = px - self.x[:n]
+        dy = py - self.y[:n]
+        mag = np.hypot(dx, dy)
+        moving = mag > 0
+        safe_mag = np.where(moving, mag, 1.0)
+        self.x[:n] += dx / safe_mag * self.speed[:n]
+        self.y[:n] += dy / safe_mag * self.speed[:n]
+        self.facing_left[:n] = np.where(moving, dx < 0, self.facing_left[:n])
+
+        self.animation_timer[:n] += moving
+        advance = self.animation_timer[:n] > ANIMATION_INTERVAL
+        frame_count = self._frame_count[self.type_id[:n]]
+        self.animation_index[:n] = np.where(advance, (self.animation_index[:n] + 1) % frame_count, self.animation_index[:n])
+        self.animation_timer[:n][advance] = 0
+
+        # Pruned in place so callers holding this list (main.py's dead_entities) stay in sync
+        update_death_animations(self.death_animations)
+
+    def take_damage(self, indices, amounts):
+        # Applies damage to enemies by index (repeats accumulate) and removes the ones that die
+        indices = np.asarray(indices, dtype=np.intp)
+        if not len(indices):
+            return 0
+        np.subtract.at(self.health, indices, amounts)
+        n = self.count
+        dead = np.flatnonzero(self.health[:n] <= 0)
+        for i in dead.tolist():
+            self._die(i)
+        if len(dead):
+            alive = np.ones(n, dtype=bool)
+            alive[dead] = False
+            self._compact(alive)
+        return len(dead)
+
+    def _die(self, i):
+        enemy_type = self.types[self.type_id[i]]
+        self.death_animations.append(death_animation_pool.acquire(
+            float(self.x[i]), float(self.y[i]), enemy_type.width, enemy_type.height,
+            enemy_type.death_frames, bool(self.facing_left[i])
+        ))
+        if (channel := pygame.mixer.find_channel()):
+            channel.play(random.choice(enemy_type.death_sounds))
+        if (drop := roll_item_drop(float(self.x[i]), float(self.y[i]), enemy_type.pickup_sound)):
+            self.item_drops.append(drop)
+        self.kills += 1
+
+    def _compact(self, alive):
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        for arr in (self.x, self.y, self.speed, self.health, self.damage, self.type_id,
+                    self.animation_index, self.animation_timer, self.facing_left):
+            arr[:k] = arr[keep]
+        self.count = k
+
+    def get_hitboxes(self):
+        # (N, 4) array of x, y, w, h matching BaseEntity.get_hitbox
+        n = self.count
+        boxes = self._hitbox[self.type_id[:n]]  # fancy indexing returns a fresh array
+        boxes[:, 0] += self.x[:n]
+        boxes[:, 1] += self.y[:n]
+        return boxes
+
+    def get_render_queue(self, camera_x, camera_y, width, height):
+        # Builds (anchor_y, frame, draw_x, draw_y) tuples only for on-screen enemies; returns them with the culled count
+        n = self.count
+        if not n:
+            return [], 0
+        w = self._width[self.type_id[:n]]
+        h = self._height[self.type_id[:n]]
+        draw_x = self.x[:n] - w // 2
+        draw_y = self.y[:n] - h
+        visible = np.flatnonzero((draw_x < camera_x + width) & (draw_x + w > camera_x) &
+                                 (draw_y < camera_y + height) & (draw_y + h > camera_y))
+
+        queue = []
+        columns = (self.y[visible].tolist(), draw_x[visible].tolist(), draw_y[visible].tolist(),
+                   self.type_id[visible].tolist(), self.animation_index[visible].tolist(), self.facing_left[visible].tolist())
+        for y, dx, dy, tid, frame_index, flipped in zip(*columns):
+            enemy_type = self.types[tid]
+            frame = (enemy_type.flipped_frames if flipped else enemy_type.frames)[frame_index]
+            queue.append((y, frame, dx, dy))
+        return queue, n - len(visible)
+
+    def clear(self):
+        self.count = 0
+        for anim in self.death_animations:
+            death_animation_pool.release(anim)
+        self.death_animations.clear()
+        for drop in self.item_drops:
+            item_drop_pool.release(drop)
+        self.item_drops.clear()
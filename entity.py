@@ -3,9 +3,11 @@ import json
 import math
 import random
 import pygame
+import asset_bank
 from attack import basic_attack, rapid_fire, can
-from biome_map import get_biome_map_colliders
-from item_drop import ItemDrop
+from collision import move_and_slide
+from item_drop import item_drop_pool
+from pool import ObjectPool
 
 ASSET_DIR = "assets"
 AUDIO_DIR = os.path.join(ASSET_DIR, "audio")
@@ -19,6 +21,27 @@ for path in [PLAYER_HITBOX_PATH, ENEMY_HITBOX_PATH]:
         with open(path, "r") as f:
             HITBOX_CONFIGS.update(json.load(f))
 
+# Per-type enemy stats, shared by the Enemy subclasses and the EnemySwarm engine
+ENEMY_STATS = {
+    "Goblin": {"prefix": "goblin", "width": 63, "height": 54, "health": 30, "speed": 1.9, "damage": 15},
+    "Orc": {"prefix": "orc", "width": 105, "height": 105, "health": 60, "speed": 1.1, "damage": 30},
+}
+
+# Player stat changes per picked-up item type (the keys of Enemy.drop_table); fire_rate is frames
+# between shots, so lower is faster
+ITEM_EFFECTS = {"heal": 1, "max_health": 1, "speed": 0.5, "fire_rate": -1, "bullet_damage": 5}
+PLAYER_MAX_SPEED = 10
+PLAYER_MIN_FIRE_RATE = 4
+
+# Enemy item drops, shared by the Enemy subclasses and the EnemySwarm engine
+DROP_CHANCE = 0.3
+DROP_TABLE = {
+    "heal": 0.6,
+    "speed": 0.25,
+    "fire_rate": 0.1,
+    "max_health": 0.05,
+}
+
 def load_image(name, size=None):
     image = pygame.image.load(os.path.join(ASSET_DIR, name)).convert_alpha()
     if size:
@@ -32,7 +55,10 @@ def load_sound(name, volume=1.0):
     return sound
 
 class DeathAnimation:
-    def __init__(self, x, y, width, height, frames, facing_left=False, frame_interval=10):
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def reset(self, x, y, width, height, frames, facing_left=False, frame_interval=10):
         self.x = x
         self.y = y
         self.width = width
@@ -82,8 +108,13 @@ class BaseEntity:
         self.facing_left = False
         self.is_dead = False
         self.death_animation = None
+        self.sweep_rect = pygame.Rect(0, 0, 0, 0)  # reused by collision.move_and_slide for broadphase queries
 
     def get_hitbox(self):
+        return pygame.Rect(self.get_hitbox_bounds())
+
+    def get_hitbox_bounds(self):
+        # Hitbox as a plain (x, y, w, h) tuple, for per-tick broadphase grids that shouldn't allocate Rects
         config = self.hitbox_config
         sprite_width = self.width
         sprite_height = self.height
@@ -94,7 +125,7 @@ class BaseEntity:
         hitbox_x = self.x + int(sprite_width * config["x_off"])
         hitbox_y = self.y - int(hitbox_height * (1 + config["y_off"]))
 
-        return pygame.Rect(hitbox_x, hitbox_y, hitbox_width, hitbox_height)
+        return hitbox_x, hitbox_y, hitbox_width, hitbox_height
 
     def take_damage(self, amount):
         self.health -= amount
@@ -104,7 +135,7 @@ class BaseEntity:
     def die(self):
         if not self.is_dead:
             self.is_dead = True
-            self.death_animation = DeathAnimation(
+            self.death_animation = death_animation_pool.acquire(
                 self.x, self.y, self.width, self.height,
                 self.death_frames, self.facing_left
             )
@@ -205,6 +236,18 @@ class Player(BaseEntity):
         self.bullet_speed = character.bullet_speed
         self.bullet_damage = character.bullet_damage
         self.last_direction = "right"
+        self.fire_cooldown = 0  # frames until the next shot is allowed
+
+    def update_fire_cooldown(self):
+        if self.fire_cooldown > 0:
+            self.fire_cooldown -= 1
+
+    def can_fire(self):
+        return self.fire_cooldown <= 0
+
+    def reset_fire_cooldown(self):
+        # fire_rate is the number of frames between shots (lower = faster)
+        self.fire_cooldown = self.fire_rate
 
     def move(self, keys):
         move_x = move_y = 0
@@ -233,13 +276,7 @@ class Player(BaseEntity):
             mag = math.hypot(move_x, move_y)
             move_x = (move_x / mag) * self.speed
             move_y = (move_y / mag) * self.speed
-            new_rect = self.get_hitbox()
-            new_rect.x += move_x
-            new_rect.y += move_y
-            trees, rocks = get_biome_map_colliders()
-            if not any(new_rect.colliderect(c) for c in trees + rocks):
-                self.x += move_x
-                self.y += move_y
+            move_and_slide(self, move_x, move_y)
 
         self.is_idle = not moving
         if "up" in self.last_direction:
@@ -248,15 +285,33 @@ class Player(BaseEntity):
             self.frames = self.character.walk_frames["down"]
         return moving
 
+    def apply_item(self, item_type):
+        # Applies a picked-up item to this run's stats; reset() restores the character's
+        amount = ITEM_EFFECTS[item_type]
+        if item_type == "heal":
+            self.health = min(self.max_health, self.health + amount)
+        elif item_type == "max_health":
+            self.max_health += amount
+            self.health += amount
+        elif item_type == "speed":
+            self.speed = min(PLAYER_MAX_SPEED, self.speed + amount)
+        elif item_type == "fire_rate":
+            self.fire_rate = max(PLAYER_MIN_FIRE_RATE, self.fire_rate + amount)
+        elif item_type == "bullet_damage":
+            self.bullet_damage += amount
+
     def reset(self, x, y):
         self.x, self.y = x, y
         self.character.reset_stats()
-        self.health = self.character.max_health
+        self.health = self.max_health = self.character.max_health
         self.speed = self.character.speed
         self.fire_rate = self.character.fire_rate
         self.bullet_damage = self.character.bullet_damage
         self.last_direction = "right"
+        self.fire_cooldown = 0
         self.animation_index = self.animation_timer = 0
+        if self.death_animation:
+            death_animation_pool.release(self.death_animation)
         self.death_animation = None
         self.is_dead = False
 
@@ -267,21 +322,24 @@ class Enemy(BaseEntity):
         self.damage = damage
         self.death_sounds = death_sounds
         self.enemy_type = enemy_type
-        self.pickup_sound = load_sound("pickup.wav")
-        self.drop_table = {
-            "heal": 0.6,
-            "speed": 0.25,
-            "fire_rate": 0.1,
-            "max_health": 0.05,
-        }
+        self.pickup_sound = asset_bank.get_sound("pickup.wav")
+        self.drop_table = DROP_TABLE
+
+    def reset(self, x, y):
+        # Returns a pooled enemy to a freshly spawned state at (x, y)
+        self.x, self.y = x, y
+        self.health = self.max_health
+        self.animation_index = self.animation_timer = 0
+        self.facing_left = False
+        self.is_dead = False
+        self.death_animation = None
 
     def move_toward_player(self, px, py):
         dx, dy = px - self.x, py - self.y
         mag = math.hypot(dx, dy)
         if mag:
             dx /= mag; dy /= mag
-            self.x += dx * self.speed
-            self.y += dy * self.speed
+            move_and_slide(self, dx * self.speed, dy * self.speed)
             self.facing_left = dx < 0
 
     def die(self):
@@ -291,28 +349,58 @@ class Enemy(BaseEntity):
                 channel.play(random.choice(self.death_sounds))
 
     def roll_drop(self, volume=1.0):
-        if random.random() < 0.3:
-            item_type = random.choices(list(self.drop_table.keys()), weights=self.drop_table.values())[0]
-            return ItemDrop(self.x, self.y, item_type, self.pickup_sound, volume)
-        return None
+        return roll_item_drop(self.x, self.y, self.pickup_sound, self.drop_table, volume)
 
 
 class Goblin(Enemy):
     def __init__(self, x, y):
-        width, height = 63, 54
-        frames = [load_image(f"goblin_walk{i}.png", (height, width)) for i in (1, 2)]
-        death_frames = [load_image(f"goblin_death{i}.png", (height, width)) for i in (1, 2)]
-        sounds = [load_sound(f"goblin_death{i}.wav") for i in (1, 2)]
-        super().__init__(x, y, width, height, 30, 1.9, 15, frames, death_frames, sounds, "Goblin")
+        stats = ENEMY_STATS["Goblin"]
+        width, height = stats["width"], stats["height"]
+        frames = [asset_bank.get_sprite(f"goblin_walk{i}.png", (height, width)) for i in (1, 2)]
+        death_frames = [asset_bank.get_sprite(f"goblin_death{i}.png", (height, width)) for i in (1, 2)]
+        sounds = [asset_bank.get_sound(f"goblin_death{i}.wav") for i in (1, 2)]
+        super().__init__(x, y, width, height, stats["health"], stats["speed"], stats["damage"], frames, death_frames, sounds, "Goblin")
 
 
 class Orc(Enemy):
     def __init__(self, x, y):
-        width, height = 105, 105
-        frames = [load_image(f"orc_walk{i}.png", (height, width)) for i in (1, 2)]
-        death_frames = [load_image(f"orc_death{i}.png", (height, width)) for i in (1, 2)]
-        sounds = [load_sound(f"orc_death{i}.wav") for i in (1, 2)]
-        super().__init__(x, y, width, height, 60, 1.1, 30, frames, death_frames, sounds, "Orc")
+        stats = ENEMY_STATS["Orc"]
+        width, height = stats["width"], stats["height"]
+        frames = [asset_bank.get_sprite(f"orc_walk{i}.png", (height, width)) for i in (1, 2)]
+        death_frames = [asset_bank.get_sprite(f"orc_death{i}.png", (height, width)) for i in (1, 2)]
+        sounds = [asset_bank.get_sound(f"orc_death{i}.wav") for i in (1, 2)]
+        super().__init__(x, y, width, height, stats["health"], stats["speed"], stats["damage"], frames, death_frames, sounds, "Orc")
+
+
+death_animation_pool = ObjectPool(DeathAnimation)
+ENEMY_POOLS = {"Goblin": ObjectPool(Goblin), "Orc": ObjectPool(Orc)}
+
+def spawn_enemy(enemy_type, x, y):
+    return ENEMY_POOLS[enemy_type].acquire(x, y)
+
+def roll_item_drop(x, y, pickup_sound, drop_table=DROP_TABLE, volume=1.0):
+    # A pooled ItemDrop at (x, y) with probability DROP_CHANCE, else None
+    if random.random() < DROP_CHANCE:
+        item_type = random.choices(list(drop_table.keys()), weights=drop_table.values())[0]
+        return item_drop_pool.acquire(x, y, item_type, pickup_sound, volume)
+    return None
+
+def release_enemy(enemy):
+    ENEMY_POOLS[enemy.enemy_type].release(enemy)
+
+def update_death_animations(dead_entities):
+    # Advances death animations and prunes finished ones in place, returning them to death_animation_pool
+    for anim in dead_entities:
+        anim.update()
+        if anim.done:
+            death_animation_pool.release(anim)
+    dead_entities[:] = [anim for anim in dead_entities if not anim.done]
+
+def get_pool_stats():
+    return {
+        "death_animations": death_animation_pool.get_stats(),
+        **{name: pool.get_stats() for name, pool in ENEMY_POOLS.items()},
+    }
 
 
 def load_characters(audio):
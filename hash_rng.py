@@ -0,0 +1,83 @@
+# hash_rng.py
+# Stateless counter-based random numbers for world generation. (world seed, tx, ty, salt) is hashed
+# into a stream key, and draw `index` of that stream is the splitmix64 output at key + index * golden,
+# so there is no generator to seed per tile and any draw can be computed directly, one at a time or
+# for whole NumPy arrays of coordinates at once. Scalar and array paths give the same bits.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MUL1 = 0xBF58476D1CE4E5B9
+_MUL2 = 0x94D049BB133111EB
+# Odd multipliers spreading the key parts over all 64 bits before the finalizer
+_KEY_X = 0xD6E8FEB86659FD93
+_KEY_Y = 0xA0761D6478BD642F
+_KEY_SALT = 0xE7037ED1A0B428DB
+
+
+def _mix(z):
+    z = (z + _GOLDEN) & MASK64
+    z = ((z ^ (z >> 30)) * _MUL1) & MASK64
+    z = ((z ^ (z >> 27)) * _MUL2) & MASK64
+    return z ^ (z >> 31)
+
+
+def _mix_array(z):
+    # uint64 arithmetic wraps, which is exactly the & MASK64 of the scalar path
+    z = z + np.uint64(_GOLDEN)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MUL1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MUL2)
+    return z ^ (z >> np.uint64(31))
+
+
+def _as_u64(values):
+    # Two's complement view, so negative tile coords hash the same as (value & MASK64) does for ints
+    values = np.asarray(values)
+    if values.dtype == np.uint64:
+        return values
+    return values.astype(np.int64).view(np.uint64)
+
+
+def _is_array(*values):
+    return np is not None and any(isinstance(v, np.ndarray) for v in values)
+
+
+def stream_key(seed, tx, ty, salt=0):
+    if _is_array(seed, tx, ty, salt):
+        with np.errstate(over="ignore"):
+            return _mix_array(_mix_array(_as_u64(seed)) + _as_u64(tx) * np.uint64(_KEY_X)
+                              + _as_u64(ty) * np.uint64(_KEY_Y) + _as_u64(salt) * np.uint64(_KEY_SALT))
+    return _mix((_mix(seed & MASK64) + tx * _KEY_X + ty * _KEY_Y + salt * _KEY_SALT) & MASK64)
+
+
+def stream_draw(key, index):
+    # Draw `index` of the stream identified by `key`, as a 64-bit integer
+    if _is_array(key, index):
+        with np.errstate(over="ignore"):
+            return _mix_array(_as_u64(key) + _as_u64(index) * np.uint64(_GOLDEN))
+    return _mix((key + index * _GOLDEN) & MASK64)
+
+
+def hash_u64(seed, tx, ty, salt=0, index=0):
+    return stream_draw(stream_key(seed, tx, ty, salt), index)
+
+
+def hash_float(seed, tx, ty, salt=0, index=0):
+    # Uniform in [0, 1) with 53 bits of precision
+    h = hash_u64(seed, tx, ty, salt, index)
+    if isinstance(h, int):
+        return (h >> 11) * (1.0 / (1 << 53))
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def hash_int(seed, tx, ty, salt, index, lo, hi):
+    # Uniform integer in [lo, hi], inclusive like random.randint
+    h = hash_u64(seed, tx, ty, salt, index)
+    span = hi - lo + 1
+    if isinstance(h, int):
+        return lo + h % span
+    return lo + (h % np.uint64(span)).astype(np.int64)
+
@@ -3,9 +3,11 @@ import pygame
 import os
 import random
 import time
+from pool import ObjectPool
 
 ASSET_DIR = os.path.join("assets", "drops")
 item_size = 40
+PICKUP_RADIUS = 50
 
 def load_image(name):
     return pygame.transform.scale(
@@ -22,16 +24,19 @@ ITEM_SPRITES = {
 }
 
 class ItemDrop:
-    def __init__(self, x, y, item_type, pickup_sound, volume=1.0):
+    def __init__(self, *args, **kwargs):
+        self.reset(*args, **kwargs)
+
+    def reset(self, x, y, item_type, pickup_sound, volume=1.0):
         self.spawn_time = time.time()
         self.expiration_time = 36  # seconds
-        self.pickup_sound = pickup_sound
-        self.pickup_sound.set_volume(volume)
+        self.pickup_sound = pickup_sound  # shared through asset_bank; volume is applied per play
+        self.volume = volume
         self.x = x
         self.y = y
         self.type = item_type
         self.sprite = ITEM_SPRITES[self.type]
-        self.radius = 50  # pickup range
+        self.radius = PICKUP_RADIUS  # pickup range
 
     def is_expired(self):
         return (time.time() - self.spawn_time) > self.expiration_time
@@ -40,10 +45,32 @@ class ItemDrop:
         screen.blit(self.sprite, (self.x - camera_x, self.y - camera_y))
 
     def set_volume(self, volume):
-        self.pickup_sound.set_volume(volume)
+        self.volume = volume
 
     def check_pickup(self, player_x, player_y):
         if abs(self.x - player_x) < self.radius and abs(self.y - player_y) < self.radius:
-            self.pickup_sound.play()
+            if (channel := pygame.mixer.find_channel()):
+                channel.play(self.pickup_sound)
+                channel.set_volume(self.volume)  # play() resets the channel volume
             return True
         return False
+
+
+item_drop_pool = ObjectPool(ItemDrop)
+
+def update_item_drops(item_drops, player_x, player_y, nearby=None):
+    # Removes expired and picked-up drops in place, returning them to item_drop_pool.
+    # nearby optionally limits pickup checks to these indices (from a broadphase query).
+    # Returns the types picked up this frame.
+    picked = []
+    live = []
+    for i, item in enumerate(item_drops):
+        if (nearby is None or i in nearby) and item.check_pickup(player_x, player_y):
+            picked.append(item.type)
+            item_drop_pool.release(item)
+        elif item.is_expired():
+            item_drop_pool.release(item)
+        else:
+            live.append(item)
+    item_drops[:] = live
+    return picked
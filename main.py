@@ -3,6 +3,10 @@ import os
 import math
 
 DEBUG_DRAW_BOX = False
+USE_NUMPY_BULLETS = False  # opt-in vectorized projectile engine (needs numpy)
+USE_ENEMY_SWARM = False  # opt-in struct-of-arrays enemy engine (needs numpy)
+USE_GENERATOR_V2 = False  # opt-in counter-based hash RNG world generator (needs numpy, changes the world layout)
+USE_CHUNK_STORE = False  # opt-in on-disk cache of generated chunks (assets/data/chunk_store)
 
 # Init Pygame
 pygame.init()
@@ -12,14 +16,20 @@ pygame.display.set_caption("Survivor Game")
 
 from renderer import Renderer
 from audio import Audio
-from entity import Player, load_characters
-from biome_map import get_biome_map_colliders
+from entity import Player, load_characters, ENEMY_STATS, release_enemy, update_death_animations
+import asset_bank
+import biome_map
+import chunk_store
 from world import get_render_data
 from input import get_movement_direction, should_fire
 import save_manager
 import world
 import game_state
-from bullet import Bullet
+from bullet import MAX_BULLETS, bullet_pool, update_bullets
+from item_drop import PICKUP_RADIUS, update_item_drops
+from combat import resolve_bullet_hits, find_nearby_drops
+from bullet_system import BulletSystem, NUMPY_AVAILABLE
+from enemy_swarm import EnemySwarm
 from main_menu import MainMenu
 
 # Constants
@@ -36,6 +46,13 @@ renderer = Renderer(screen, WIDTH, HEIGHT)
 # Load Audio
 audio = Audio()
 
+# Select the world generator and chunk store before any chunk is requested
+biome_map.GENERATOR_VERSION = 2 if USE_GENERATOR_V2 and NUMPY_AVAILABLE else 1
+chunk_store.ENABLED = USE_CHUNK_STORE
+
+# Preload shared enemy sprites/sounds so spawning waves never hits the disk
+asset_bank.preload_enemy_assets(ENEMY_STATS)
+
 # Load Characters
 all_characters = load_characters(audio)
 save_data = save_manager.load_save_data()
@@ -44,7 +61,10 @@ selected_character = next((c for c in all_characters if c.name == save_data["sel
 # Player initialization
 player = Player(selected_character, WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
 camera_x = camera_y = 0
-bullets = []
+bullets = BulletSystem() if USE_NUMPY_BULLETS and NUMPY_AVAILABLE else []
+enemies = EnemySwarm() if USE_ENEMY_SWARM and NUMPY_AVAILABLE else []
+dead_entities = enemies.death_animations if isinstance(enemies, EnemySwarm) else []
+item_drops = []
 
 # Game State
 MENU = "MENU"
@@ -110,17 +130,56 @@ while running:
         ##          IS ROTATED EVERY ANIMATION FRAME
         ##          AFTER X ANIMATION FRAMES CULL BULLET?
         ##             maybe just reintroduce the cull
-        if should_fire(keys):
+        player.update_fire_cooldown()
+        if isinstance(bullets, BulletSystem):
+            if should_fire(keys) and player.can_fire():
+                player.reset_fire_cooldown()
+                bullets.spawn(player.x, player.y, DIRECTION_ANGLES[player.last_direction],
+                              player.bullet_speed, player.bullet_damage, player.bullet_sprite,
+                              facing_left=player.facing_left, sprite_name=player.character.name)
+        elif should_fire(keys) and player.can_fire() and len(bullets) < MAX_BULLETS:
+            player.reset_fire_cooldown()
             angle = DIRECTION_ANGLES[player.last_direction]
-            bullet = Bullet(player.x, player.y, angle,
-                            player.bullet_speed, player.bullet_damage,
-                            player.bullet_sprite,
-                            facing_left=player.facing_left, sprite_name=player.character.name)
+            bullet = bullet_pool.acquire(player.x, player.y, angle,
+                                         player.bullet_speed, player.bullet_damage,
+                                         player.bullet_sprite,
+                                         facing_left=player.facing_left, sprite_name=player.character.name)
             bullets.append(bullet)
             #audio.get("shoot").play()
 
-        # Update Bullets
-        bullets = [b for b in bullets if not b.update()]
+        # Update Bullets (expired by range, lifetime or leaving the loaded world)
+        if isinstance(bullets, BulletSystem):
+            bullets.update(world.get_active_area())
+        else:
+            bullets = update_bullets(bullets, world.get_active_area())
+
+        # Update Enemies
+        if isinstance(enemies, EnemySwarm):
+            item_drops.extend(enemies.item_drops)
+            enemies.item_drops.clear()
+            enemies.update(player.x, player.y)
+        else:
+            # Hand enemies killed last frame to the death animation and drop layers first, so they
+            # don't move or advance their animation again before being recycled
+            for enemy in enemies:
+                if enemy.is_dead:
+                    dead_entities.append(enemy.death_animation)
+                    if (drop := enemy.roll_drop()):
+                        item_drops.append(drop)
+                    release_enemy(enemy)
+            enemies = [enemy for enemy in enemies if not enemy.is_dead]
+            for enemy in enemies:
+                enemy.move_toward_player(player.x, player.y)
+                enemy.update_animation(True)
+            update_death_animations(dead_entities)
+
+        # Bullet hits (broadphase grid rebuilt each tick); killed enemies are collected next frame
+        resolve_bullet_hits(bullets, enemies)
+
+        # Item drops (expired or picked-up drops return to their pool; pickups apply to the player)
+        for item_type in update_item_drops(item_drops, player.x, player.y,
+                                           find_nearby_drops(item_drops, player.x, player.y, PICKUP_RADIUS)):
+            player.apply_item(item_type)
 
         # Update Camera
         camera_x = player.x - WIDTH // 2
@@ -133,16 +192,23 @@ while running:
 
         # Draw tile_layers
         if DEBUG_DRAW_BOX == True:
-            trees = get_biome_map_colliders()[0]
-            rocks = get_biome_map_colliders()[1]
+            trees = world.get_tree_colliders()
+            rocks = world.get_rock_colliders()
             all_map_colliders = trees + rocks
             renderer.draw_hitboxes(player,[],[], camera_x, camera_y)
-            renderer.draw(player, camera_x, camera_y, bullets, [], [], [],
+            renderer.draw(player, camera_x, camera_y, bullets, enemies, dead_entities, item_drops,
                           tile_layers, render_objects, center_chunk, tree_colliders=trees)
             debug_font = pygame.font.SysFont(None, 20)
             renderer.draw_debug_chunks(world._loaded_chunks, camera_x, camera_y, debug_font)
+            renderer.draw_cull_stats(debug_font)
+            collider_stats = world.get_collider_stats()
+            renderer.draw_debug_text(debug_font, f"Colliders: {len(all_map_colliders)} "
+                                                 f"({collider_stats['per_chunk']:.1f}/chunk over {collider_stats['loaded_chunks']} chunks)", 70)
+            region_stats = biome_map.get_region_cache_stats()
+            renderer.draw_debug_text(debug_font, f"Region cache: {region_stats['size']} cells, "
+                                                 f"{region_stats['hit_rate']:.1%} hits", 90)
         else:
-            renderer.draw(player, camera_x, camera_y, bullets, [], [], [],
+            renderer.draw(player, camera_x, camera_y, bullets, enemies, dead_entities, item_drops,
                           tile_layers, render_objects, center_chunk)
 
     # Update Display
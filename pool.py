@@ -0,0 +1,41 @@
+# pool.py
+# Recycles short-lived game objects (bullets, death animations, item drops, enemies) through free lists
+# so long waves don't churn allocations. Pooled classes implement reset() with the same arguments as
+# __init__; acquire() either resets a free object or builds a new one.
+
+
+class ObjectPool:
+    def __init__(self, factory, max_free=1024):
+        self.factory = factory
+        self.max_free = max_free  # free objects beyond this are dropped for the GC
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0  # most objects ever live at once
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def get_stats(self):
+        return {
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
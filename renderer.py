@@ -1,7 +1,9 @@
 # renderer.py
 import pygame
-import math
-from world import get_render_data, load_image
+import heapq
+from operator import itemgetter
+from world import get_render_data, get_cull_stats, load_sprite
+from sprite_cache import SpriteVariantCache
 
 class Renderer:
     def __init__(self, screen, width, height, tile_size=150):
@@ -10,55 +12,105 @@ class Renderer:
         self.HEIGHT = height
         self.TILE_SIZE = tile_size
         self.DEBUG_DRAW_HITBOXES = False
+        self.sprite_cache = SpriteVariantCache(load_sprite)  # keyed by sprite_registry id
+        self.cull_stats = {"drawn": 0, "culled": 0}
+        self._submit_blits = self._get_batch_blitter(screen)
+
+    @staticmethod
+    def _get_batch_blitter(screen):
+        # fblits (pygame-ce) skips building the rect list; plain pygame falls back to blits
+        if hasattr(screen, "fblits"):
+            return screen.fblits
+        return lambda batch: screen.blits(batch, doreturn=False)
+
+    def _in_view(self, camera_x, camera_y, x, y, w, h):
+        return x < camera_x + self.WIDTH and x + w > camera_x and y < camera_y + self.HEIGHT and y + h > camera_y
 
     def draw(self, player, camera_x, camera_y, bullets, enemies, dead_entities, item_drops, tile_layers, render_objects, center_chunk, tree_colliders=None):
         self.screen.fill((0, 0, 0))
         render_queue = []
-
-        for tile_img, x, y in tile_layers:
-            sx, sy = x - camera_x, y - camera_y
-            self.screen.blit(tile_img, (sx, sy))
-
-        # Add world objects to render queue
-        for obj in render_objects:
-            img = load_image(obj["filename"])
-            scale_x, scale_y = obj.get("scale_x", 1.0), obj.get("scale_y", 1.0)
-            flipped = obj.get("flipped", False)
-
-            if flipped:
-                img = pygame.transform.flip(img, True, False)
-            if scale_x != 1.0 or scale_y != 1.0:
-                img = pygame.transform.scale(img, (int(img.get_width() * scale_x), int(img.get_height() * scale_y)))
-
-            sx, sy = obj["x"] - camera_x, obj["y"] - camera_y
-            anchor_y = obj["y"] + img.get_height()
-            render_queue.append((anchor_y, img, obj["x"], obj["y"]))
-
-        # Add dead entities
-        render_queue += [ent.get_render_data() for ent in dead_entities if not ent.done]
-
-        # Add enemies
-        render_queue += [e.get_render_data() for e in enemies if not e.is_dead]
+        blit_batch = []  # (surface, dest) pairs in draw order, submitted in one call
+
+        # Chunk grounds and world objects arrive already culled by get_render_data
+        world_stats = get_cull_stats()
+        drawn, culled = world_stats["drawn"], world_stats["culled"]
+
+        blit_batch += [(tile_img, (x - camera_x, y - camera_y)) for tile_img, x, y in tile_layers]
+
+        # World objects arrive as per-chunk runs already sorted by anchor Y
+        static_runs = []
+        sprite_get = self.sprite_cache.get
+        for run in render_objects:
+            static_runs.append([
+                (anchor_y, sprite_get(obj.sprite, obj.scale_x, obj.scale_y, obj.flipped), obj.x, obj.y)
+                for anchor_y, obj in run
+            ])
+
+        # Add dead entities and enemies that are on screen (sprites are drawn centered above x, y)
+        for ent in dead_entities:
+            if ent.done:
+                continue
+            if self._in_view(camera_x, camera_y, ent.x - ent.width // 2, ent.y - ent.height, ent.width, ent.height):
+                render_queue.append(ent.get_render_data())
+                drawn += 1
+            else:
+                culled += 1
+
+        if hasattr(enemies, "get_render_queue"):
+            # EnemySwarm culls in bulk and only builds tuples for visible enemies
+            enemy_queue, enemies_culled = enemies.get_render_queue(camera_x, camera_y, self.WIDTH, self.HEIGHT)
+            render_queue += enemy_queue
+            drawn += len(enemy_queue)
+            culled += enemies_culled
+        else:
+            for e in enemies:
+                if e.is_dead:
+                    continue
+                if self._in_view(camera_x, camera_y, e.x - e.width // 2, e.y - e.height, e.width, e.height):
+                    render_queue.append(e.get_render_data())
+                    drawn += 1
+                else:
+                    culled += 1
 
         # Add player
         render_queue.append(player.get_render_data())
+        drawn += 1
 
-        # Y-sort
-        render_queue.sort(key=lambda t: t[0])
+        # Y-sort the few moving entities, then merge them with the pre-sorted static runs
+        render_queue.sort(key=itemgetter(0))
 
         # Draw sorted entities and objects
-        for _, img, x, y in render_queue:
-            self.screen.blit(img, (x - camera_x, y - camera_y))
-
-        # Draw rotated bullets after sorting
-        for bullet in bullets:
-            rotated = pygame.transform.rotate(bullet.sprite, -math.degrees(bullet.angle))
-            sx, sy = bullet.x - camera_x, bullet.y - camera_y
-            self.screen.blit(rotated, (sx, sy))
+        blit_batch += [(img, (x - camera_x, y - camera_y))
+                       for _, img, x, y in heapq.merge(*static_runs, render_queue, key=itemgetter(0))]
+
+        # Draw bullets after sorting, using their cached pre-rotated frame
+        if hasattr(bullets, "get_blits"):
+            # Vectorized BulletSystem hands back visible blits in bulk
+            bullet_blits, bullets_culled = bullets.get_blits(camera_x, camera_y, self.WIDTH, self.HEIGHT)
+            blit_batch += bullet_blits
+            drawn += len(bullet_blits)
+            culled += bullets_culled
+        else:
+            for bullet in bullets:
+                frame = bullet.frame
+                if not self._in_view(camera_x, camera_y, bullet.x, bullet.y, frame.get_width(), frame.get_height()):
+                    culled += 1
+                    continue
+                blit_batch.append((frame, (bullet.x - camera_x, bullet.y - camera_y)))
+                drawn += 1
 
         # Item drops
         for item in item_drops:
-            item.draw(self.screen, camera_x, camera_y)
+            if not self._in_view(camera_x, camera_y, item.x, item.y, item.sprite.get_width(), item.sprite.get_height()):
+                culled += 1
+                continue
+            blit_batch.append((item.sprite, (item.x - camera_x, item.y - camera_y)))
+            drawn += 1
+
+        self._submit_blits(blit_batch)
+
+        self.cull_stats["drawn"] = drawn
+        self.cull_stats["culled"] = culled
 
         if tree_colliders:
             for rect in tree_colliders:
@@ -69,10 +121,12 @@ class Renderer:
             self.draw_hitboxes(player, bullets, enemies, camera_x, camera_y)
 
     def draw_hitboxes(self, player, bullets, enemies, camera_x, camera_y):
-        for e in enemies:
-            pygame.draw.rect(self.screen, (255, 0, 255), e.get_hitbox().move(-camera_x, -camera_y), 2)
-        for b in bullets:
-            pygame.draw.rect(self.screen, (0, 255, 255), b.get_hitbox().move(-camera_x, -camera_y), 2)
+        enemy_boxes = enemies.get_hitboxes().tolist() if hasattr(enemies, "get_hitboxes") else [e.get_hitbox() for e in enemies]
+        for box in enemy_boxes:
+            pygame.draw.rect(self.screen, (255, 0, 255), pygame.Rect(box).move(-camera_x, -camera_y), 2)
+        hitboxes = bullets.get_hitboxes().tolist() if hasattr(bullets, "get_hitboxes") else [b.get_hitbox() for b in bullets]
+        for box in hitboxes:
+            pygame.draw.rect(self.screen, (0, 255, 255), pygame.Rect(box).move(-camera_x, -camera_y), 2)
         # pygame.draw.rect(self.screen, (255, 255, 0), player.get_hitbox().move(-camera_x, -camera_y), 2)
 
     def draw_ui(self, font, wave, score, kills, current_hp, max_hp):
@@ -83,6 +137,12 @@ class Renderer:
         pygame.draw.rect(self.screen, (255, 0, 0), (10, 10, 100, 10))
         pygame.draw.rect(self.screen, (0, 255, 0), (10, 10, 100 * (current_hp / max_hp), 10))
 
+    def draw_debug_text(self, font, text, y):
+        self.screen.blit(font.render(text, True, (255, 255, 255)), (10, y))
+
+    def draw_cull_stats(self, font):
+        self.draw_debug_text(font, f"Drawn: {self.cull_stats['drawn']}  Culled: {self.cull_stats['culled']}", 50)
+
     def draw_chunk_center(self, chunk, camera_x, camera_y):
         TILE_SIZE = 150
         CHUNK_SIZE = 5
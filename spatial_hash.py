@@ -0,0 +1,129 @@
+# spatial_hash.py
+# Uniform-grid spatial hash for static world colliders. Rects are registered under an owner key
+# (the chunk coord) so a whole chunk's colliders can be added or removed in one call.
+import math
+
+
+def _cell_span(start, size, cell_size):
+    # Cells covered by the half-open interval [start, start + size); always at least one
+    first = int(start // cell_size)
+    last = math.ceil((start + size) / cell_size) - 1
+    return range(first, max(first, last) + 1)
+
+
+class SpatialHash:
+    def __init__(self, cell_size=150):
+        self.cell_size = cell_size
+        self._cells = {}  # (cell_x, cell_y) -> list of (owner, rect)
+        self._owners = {}  # owner -> list of (rect, cells)
+
+    def _cell_range(self, x, y, w, h):
+        return _cell_span(x, w, self.cell_size), _cell_span(y, h, self.cell_size)
+
+    def add(self, owner, rects):
+        entries = self._owners.setdefault(owner, [])
+        for rect in rects:
+            xs, ys = self._cell_range(rect.x, rect.y, rect.w, rect.h)
+            cells = [(cx, cy) for cx in xs for cy in ys]
+            for cell in cells:
+                self._cells.setdefault(cell, []).append((owner, rect))
+            entries.append((rect, cells))
+
+    def remove(self, owner):
+        for rect, cells in self._owners.pop(owner, ()):
+            for cell in cells:
+                bucket = self._cells.get(cell)
+                if bucket is None:
+                    continue
+                bucket[:] = [entry for entry in bucket if entry[1] is not rect]
+                if not bucket:
+                    del self._cells[cell]
+
+    def owners(self):
+        return self._owners.keys()
+
+    def query_rect(self, rect):
+        # Candidate rects in every cell the query rect overlaps (each returned once)
+        xs, ys = self._cell_range(rect.x, rect.y, rect.w, rect.h)
+        if len(xs) * len(ys) == 1:
+            bucket = self._cells.get((xs[0], ys[0]))
+            return [r for _, r in bucket] if bucket else []
+        seen = set()
+        found = []
+        for cx in xs:
+            for cy in ys:
+                for _, r in self._cells.get((cx, cy), ()):
+                    if id(r) not in seen:
+                        seen.add(id(r))
+                        found.append(r)
+        return found
+
+    def query_point(self, x, y):
+        cs = self.cell_size
+        return [r for _, r in self._cells.get((int(x // cs), int(y // cs)), ()) if r.collidepoint(x, y)]
+
+    def get_stats(self):
+        return {
+            "owners": len(self._owners),
+            "cells": len(self._cells),
+            "rects": sum(len(entries) for entries in self._owners.values()),
+        }
+
+
+class DynamicGrid:
+    # Uniform grid for moving things (enemies, bullets, item drops), rebuilt every tick.
+    # Each layer holds plain (x, y, w, h) boxes addressed by their index in the caller's list.
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self._layers = {}  # name -> (boxes, cells dict (cell_x, cell_y) -> [index, ...])
+
+    def rebuild(self, layer, boxes):
+        cs = self.cell_size
+        cells = {}
+        for i, (x, y, w, h) in enumerate(boxes):
+            for cx in _cell_span(x, w, cs):
+                for cy in _cell_span(y, h, cs):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [i]
+                    else:
+                        bucket.append(i)
+        self._layers[layer] = (boxes, cells)
+
+    def query(self, layer, box):
+        # Indices in `layer` whose boxes overlap `box`
+        boxes, cells = self._layers[layer]
+        x, y, w, h = box
+        cs = self.cell_size
+        found = set()
+        for cx in _cell_span(x, w, cs):
+            for cy in _cell_span(y, h, cs):
+                for i in cells.get((cx, cy), ()):
+                    if i in found:
+                        continue
+                    bx, by, bw, bh = boxes[i]
+                    if x < bx + bw and bx < x + w and y < by + bh and by < y + h:
+                        found.add(i)
+        return found
+
+    def pairs(self, layer_a, layer_b):
+        # Every overlapping (index_a, index_b) pair: candidates come from shared cells, then an AABB
+        # narrowphase; each pair is reported once even when the boxes share several cells
+        boxes_a, cells_a = self._layers[layer_a]
+        boxes_b, cells_b = self._layers[layer_b]
+        seen = set()
+        result = []
+        for cell, members_a in cells_a.items():
+            members_b = cells_b.get(cell)
+            if not members_b:
+                continue
+            for ia in members_a:
+                ax, ay, aw, ah = boxes_a[ia]
+                for ib in members_b:
+                    if (ia, ib) in seen:
+                        continue
+                    bx, by, bw, bh = boxes_b[ib]
+                    if ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah:
+                        seen.add((ia, ib))
+                        result.append((ia, ib))
+        return result
@@ -0,0 +1,79 @@
+# sprite_cache.py
+# Caches scaled/flipped variants of world sprites so they are built once instead of every frame
+import pygame
+from collections import OrderedDict
+
+SCALE_STEP = 0.01  # scales are snapped to this step before keying the cache
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def quantize_scale(scale, step=SCALE_STEP):
+    return int(round(scale / step))
+
+
+class SpriteVariantCache:
+    def __init__(self, load_image_fn, budget_bytes=DEFAULT_BUDGET_BYTES, scale_step=SCALE_STEP):
+        self.load_image = load_image_fn
+        self.budget_bytes = budget_bytes
+        self.scale_step = scale_step
+        self._variants = OrderedDict()  # key = (sprite, qx, qy, flipped), value = Surface
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, sprite, scale_x=1.0, scale_y=1.0, flipped=False):
+        # sprite is whatever load_image_fn takes (a sprite_registry id for the world renderer)
+        qx = quantize_scale(scale_x, self.scale_step)
+        qy = quantize_scale(scale_y, self.scale_step)
+        unit = quantize_scale(1.0, self.scale_step)
+
+        # Unscaled, unflipped sprites are already cached by the asset loader
+        if qx == unit and qy == unit and not flipped:
+            return self.load_image(sprite)
+
+        key = (sprite, qx, qy, flipped)
+        img = self._variants.get(key)
+        if img is not None:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return img
+
+        self.misses += 1
+        img = self.load_image(sprite)
+        if flipped:
+            img = pygame.transform.flip(img, True, False)
+        if qx != unit or qy != unit:
+            width = int(img.get_width() * qx * self.scale_step)
+            height = int(img.get_height() * qy * self.scale_step)
+            img = pygame.transform.scale(img, (width, height))
+
+        self._variants[key] = img
+        self.bytes_used += self._surface_bytes(img)
+        self._evict()
+        return img
+
+    def _evict(self):
+        # Drop least recently used variants until we are back under budget (always keep the newest)
+        while self.bytes_used > self.budget_bytes and len(self._variants) > 1:
+            _, img = self._variants.popitem(last=False)
+            self.bytes_used -= self._surface_bytes(img)
+            self.evictions += 1
+
+    def clear(self):
+        self._variants.clear()
+        self.bytes_used = 0
+
+    def get_stats(self):
+        return {
+            "variants": len(self._variants),
+            "bytes_used": self.bytes_used,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _surface_bytes(img):
+        return img.get_width() * img.get_height() * img.get_bytesize()
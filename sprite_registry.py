@@ -0,0 +1,28 @@
+# sprite_registry.py
+# Small integer ids for world sprite filenames, so chunk object tables store one int per object instead
+# of a filename string. Ids are handed out on first use and stay fixed for the process; the chunk
+# worker threads register through a lock.
+import threading
+
+_names = []  # id -> filename
+_ids = {}  # filename -> id
+_lock = threading.Lock()
+
+
+def sprite_id(name):
+    sid = _ids.get(name)
+    if sid is None:
+        with _lock:
+            sid = _ids.get(name)
+            if sid is None:
+                sid = _ids[name] = len(_names)
+                _names.append(name)
+    return sid
+
+
+def sprite_name(sid):
+    return _names[sid]
+
+
+def get_stats():
+    return {"sprites": len(_names)}
@@ -3,9 +3,16 @@ import os
 import math
 import pygame
 import json
-from biome_map import draw_ground, get_biome_at, get_tile_for_biome
+import time
+from biome_map import (BIOME_NAMES, BIOME_TILE_VARIANTS, DECOR_COLLISION, DECOR_FLAT, get_biome_field,
+                       get_variant_field, spawn_chunk_decorations, decoration_colliders, set_region_cache_center)
+from sprite_registry import sprite_name
+import chunk_store
+from chunk_store import StoredChunk
 import threading
-from queue import Queue
+from collections import OrderedDict
+from chunk_queue import QUEUED, ChunkRequestQueue
+from spatial_hash import SpatialHash
 
 TILE_SIZE = 150
 CHUNK_SIZE = 5  # in tiles
@@ -14,21 +21,72 @@ CHUNK_SIZE = 5  # in tiles
 _asset_cache = {}
 
 _last_active_chunk = None
+_last_anchor = None
+_heading = (0.0, 0.0)  # unit vector of the camera's movement last frame
 
 OBJECT_ASSET_DIR = os.path.join("assets", "world")
 TILE_ASSET_DIR = os.path.join("assets", "world", "tiles", "world")
 
-chunk_load_queue = Queue()
+CHUNK_WORKERS = 2  # number of chunk generation threads
+HEADING_BIAS = 1.5  # how strongly chunks ahead of the player jump the queue
+
+# Chunk retention: chunks within CHUNK_HYSTERESIS rings of the target window stay loaded; beyond
+# that they move into an LRU cache bounded by count and bytes instead of being dropped.
+# A chunk's ground and decal surfaces take ~5-6 MB (a ~955 px square ground at 4 bytes per pixel plus
+# a ~750 px decal layer), so with one hysteresis ring the 7x6 = 42 resident chunks alone hold ~230 MB.
+# CHUNK_MEMORY_MAX_BYTES covers resident and cached chunks together: the cache shrinks to whatever the
+# resident set leaves (~16 chunks at the defaults), less room for every chunk still queued or being
+# generated, since workers publish between trims. Resident chunks are never evicted for it, so the
+# bound holds while the resident set alone fits and new chunks are no larger than the largest resident one.
+CHUNK_HYSTERESIS = 1
+CHUNK_CACHE_MAX_CHUNKS = 48
+CHUNK_MEMORY_MAX_BYTES = 320 * 1024 * 1024
+
+chunk_load_queue = ChunkRequestQueue()
+
+# _loaded_chunks is copy-on-write: writers build a new dict under this lock and swap the reference in,
+# so the per-frame read path can use whatever snapshot it grabs without locking.
 _loaded_chunks_lock = threading.Lock()
 
+# How often the main thread had to wait on _loaded_chunks_lock, and for how long
+_lock_stats = {"acquisitions": 0, "contended": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+
+def _acquire_chunks_lock_timed():
+    _lock_stats["acquisitions"] += 1
+    if _loaded_chunks_lock.acquire(blocking=False):
+        return
+    start = time.perf_counter()
+    _loaded_chunks_lock.acquire()
+    wait_ms = (time.perf_counter() - start) * 1000
+    _lock_stats["contended"] += 1
+    _lock_stats["wait_ms_total"] += wait_ms
+    _lock_stats["wait_ms_max"] = max(_lock_stats["wait_ms_max"], wait_ms)
+
+def _publish_chunk(chunk):
+    global _loaded_chunks
+    with _loaded_chunks_lock:
+        if chunk.coord in _loaded_chunks or not chunk_load_queue.is_wanted(chunk.coord):
+            return
+        published = dict(_loaded_chunks)
+        published[chunk.coord] = chunk
+        _loaded_chunks = published
+
 def _chunk_loader_thread():
     while True:
         chunk = chunk_load_queue.get()
         if chunk is None:
             break
-        with _loaded_chunks_lock:
-            if chunk not in _loaded_chunks:
-                generate_chunk(*chunk)
+        try:
+            # Skip chunks the player walked away from while this request was in flight.
+            # Generation runs on private data; only the publish step takes the lock.
+            if chunk not in _loaded_chunks and chunk_load_queue.is_wanted(chunk):
+                store_writes = []
+                _publish_chunk(generate_chunk(*chunk, store_writes=store_writes))
+                # Write freshly generated chunks back to the on-disk store after publishing
+                for cx, cy, stored in store_writes:
+                    chunk_store.save(cx, cy, stored)
+        finally:
+            chunk_load_queue.done(chunk)
 
 def load_image(name):
     if name not in _asset_cache:
@@ -42,9 +100,9 @@ def load_image(name):
             _asset_cache[name] = pygame.image.load(path).convert_alpha()
     return _asset_cache[name]
 
-# Global collider lists for collision checks
-_tree_colliders = []
-_rock_colliders = []
+def load_sprite(sprite):
+    # load_image for a sprite_registry id
+    return load_image(sprite_name(sprite))
 
 # Load hitbox configuration from town editor
 HITBOX_CONFIG_PATH = os.path.join("assets", "data", "building_hitboxes.json")
@@ -55,15 +113,96 @@ else:
     hitbox_config = {}
 
 # Chunk system
-_loaded_chunks = {}  # key = (chunk_x, chunk_y), value = (tiles, objects)
+_loaded_chunks = {}  # key = (chunk_x, chunk_y), value = Chunk
+
+class WorldObject:
+    # One static placed sprite. A slotted record instead of a dict with string keys: a fraction of the
+    # memory per object, and the renderer reads plain attributes. sprite is a sprite_registry id.
+    __slots__ = ("sprite", "x", "y", "scale_x", "scale_y", "flipped", "has_collision")
+
+    def __init__(self, sprite, x, y, scale_x=1.0, scale_y=1.0, flipped=False, has_collision=False):
+        self.sprite = sprite
+        self.x = x
+        self.y = y
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        self.flipped = flipped
+        self.has_collision = has_collision
+
+class Chunk:
+    def __init__(self, coord, tiles, objects, ground, decals=None, tree_colliders=(), rock_colliders=()):
+        self.coord = coord
+        # Colliders are owned by the chunk, so they load and unload together with it
+        self.tree_colliders = list(tree_colliders)
+        self.rock_colliders = list(rock_colliders)
+        self.tiles = tiles  # raw (tile_img, x, y) placements, kept for debugging/tools
+        self.ground = ground  # (surface, x, y) with the chunk's tiles pre-composited
+        # (surface, x, y) with flat decorations (grass) pre-composited, or None. Kept apart from ground
+        # because tiles overlap into neighbouring chunks: every chunk's ground is drawn before any decals.
+        self.decals = decals
+
+        # Static objects never move, so sort them by anchor Y (sprite bottom) once here; the renderer
+        # merges these runs with the moving entities instead of re-sorting everything every frame.
+        # object_rects doubles as the bounding index used for viewport culling.
+        placed = sorted(((get_object_rect(obj), obj) for obj in objects), key=lambda p: p[0].bottom)
+        self.objects = [obj for _, obj in placed]  # Y-sorted WorldObjects (flat decorations are baked into decals)
+        self.object_rects = [rect for rect, _ in placed]
+        layers = [ground] if decals is None else [ground, decals]
+        layer_rects = [pygame.Rect(x, y, surface.get_width(), surface.get_height()) for surface, x, y in layers]
+        self.bounds = layer_rects[0].unionall(layer_rects[1:] + self.object_rects)
+        self.nbytes = sum(surface.get_width() * surface.get_height() * surface.get_bytesize() for surface, _, _ in layers)
+
+# Evicted chunks kept for reuse (main thread only), key = (chunk_x, chunk_y), value = Chunk
+_chunk_cache = OrderedDict()
+_chunk_cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+# Surface bytes of one _loaded_chunks snapshot: (snapshot, total bytes, largest chunk's bytes)
+_resident_bytes_cache = (None, 0, 0)
+
+def _resident_bytes():
+    # Returns (total, largest); recomputed only when the snapshot is swapped
+    global _resident_bytes_cache
+    snapshot = _loaded_chunks
+    if _resident_bytes_cache[0] is not snapshot:
+        sizes = [chunk.nbytes for chunk in snapshot.values()]
+        _resident_bytes_cache = (snapshot, sum(sizes), max(sizes, default=0))
+    return _resident_bytes_cache[1:]
+
+def _cache_chunk(chunk):
+    _chunk_cache[chunk.coord] = chunk
+    _chunk_cache.move_to_end(chunk.coord)
+    _chunk_cache_stats["bytes"] += chunk.nbytes
+
+def _trim_chunk_cache():
+    # Evicts least recently used cached chunks until the cache, the resident set and every chunk
+    # workers may still publish before the next trim fit the budgets
+    resident, largest = _resident_bytes()
+    budget = CHUNK_MEMORY_MAX_BYTES - resident - chunk_load_queue.outstanding() * largest
+    while _chunk_cache and (len(_chunk_cache) > CHUNK_CACHE_MAX_CHUNKS or
+                            _chunk_cache_stats["bytes"] > budget):
+        _, old = _chunk_cache.popitem(last=False)
+        _chunk_cache_stats["bytes"] -= old.nbytes
+        _chunk_cache_stats["evictions"] += 1
+
+def _take_cached_chunk(coord):
+    chunk = _chunk_cache.pop(coord, None)
+    if chunk is not None:
+        _chunk_cache_stats["bytes"] -= chunk.nbytes
+    return chunk
+
+# Per-frame culling counters for the world layers, filled in by get_render_data
+_cull_stats = {"drawn": 0, "culled": 0}
+
+def get_object_rect(obj):
+    image = load_sprite(obj.sprite)
+    return pygame.Rect(obj.x, obj.y, int(image.get_width() * obj.scale_x), int(image.get_height() * obj.scale_y))
 
 def calculate_hitbox(obj):
-    cfg = hitbox_config.get(obj["filename"], {})
-    scale = obj.get("scale_x", 1.0)
-    image = load_image(obj["filename"])
-    width = int(image.get_width() * scale)
-    height = int(image.get_height() * obj.get("scale_y", 1.0))
-    x, y = obj["x"], obj["y"]
+    cfg = hitbox_config.get(sprite_name(obj.sprite), {})
+    image = load_sprite(obj.sprite)
+    width = int(image.get_width() * obj.scale_x)
+    height = int(image.get_height() * obj.scale_y)
+    x, y = obj.x, obj.y
 
     anchor_x = x + width // 2
     anchor_y = y + height
@@ -73,32 +212,85 @@ def calculate_hitbox(obj):
     ox = cfg.get("collision_offset_right_scale", 0.1)
     oy = cfg.get("collision_offset_up_scale", 0.1)
 
-    if obj.get("flipped", False):
+    if obj.flipped:
         ox = 1.0 - ox
 
     hx = anchor_x + int(width * (ox - 0.5))
     hy = anchor_y - int(h * (1 + oy))
     return pygame.Rect(hx, hy, w, h)
 
-def generate_chunk(cx, cy):
+def _bake_layer(layers):
+    # Composite (img, x, y) placements into one surface; returns (surface, left, top), or None if empty
+    if not layers:
+        return None
+    left = min(x for _, x, _ in layers)
+    top = min(y for _, _, y in layers)
+    right = max(x + img.get_width() for img, x, _ in layers)
+    bottom = max(y + img.get_height() for img, _, y in layers)
+
+    surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+    for img, x, y in layers:
+        surface.blit(img, (x - left, y - top))
+    return surface, left, top
+
+def bake_chunk_ground(tile_data, flat_objects):
+    # Composite a chunk's tiles, and separately its flat decorations, so each costs a single blit per frame.
+    # Returns (ground, decals); decals is None for chunks without flat decorations.
+    decals = []
+    for obj in flat_objects:
+        img = load_sprite(obj.sprite)
+        if obj.flipped:
+            img = pygame.transform.flip(img, True, False)
+        if obj.scale_x != 1.0 or obj.scale_y != 1.0:
+            img = pygame.transform.scale(img, (int(img.get_width() * obj.scale_x), int(img.get_height() * obj.scale_y)))
+        decals.append((img, obj.x, obj.y))
+    return _bake_layer(tile_data), _bake_layer(decals)
+
+def _generate_chunk_data(cx, cy):
+    tx0, ty0 = cx * CHUNK_SIZE, cy * CHUNK_SIZE
+    biomes = get_biome_field(tx0, ty0, CHUNK_SIZE, CHUNK_SIZE)
+    variants = get_variant_field(tx0, ty0, CHUNK_SIZE, CHUNK_SIZE, biomes)
+    tiles = [BIOME_TILE_VARIANTS[BIOME_NAMES[biomes[dx][dy]]][variants[dx][dy]]
+             for dx in range(CHUNK_SIZE) for dy in range(CHUNK_SIZE)]
+    decorations = spawn_chunk_decorations(tx0, ty0, CHUNK_SIZE, CHUNK_SIZE, biomes)
+    tree_colliders, rock_colliders = decoration_colliders(decorations)
+    return StoredChunk(tiles, decorations, tree_colliders, rock_colliders)
+
+def _build_chunk(cx, cy, stored):
     tile_data = []
-    obj_data = []
-
+    tile_names = iter(stored.tiles)
     for dx in range(CHUNK_SIZE):
         for dy in range(CHUNK_SIZE):
             tx = cx * CHUNK_SIZE + dx
             ty = cy * CHUNK_SIZE + dy
-            biome = get_biome_at(tx, ty)
-            tile_img = get_tile_for_biome(tx, ty, biome, load_image)
-            tile_data.append((tile_img, tx * TILE_SIZE, ty * TILE_SIZE))
-
-            draw_ground(screen=None, camera_x=0, camera_y=0, tile_size=TILE_SIZE,
-                        load_image_fn=load_image, placed_assets=obj_data, specific_tile=(tx, ty))
-
-    _loaded_chunks[(cx, cy)] = (tile_data, obj_data)
-    return tile_data, obj_data
-
-def _update_loaded_chunks(center_chunk):
+            tile_data.append((load_image(next(tile_names)), tx * TILE_SIZE, ty * TILE_SIZE))
+
+    flat_objects, objects = [], []
+    for sprite, x, y, scale, flags in stored.decorations.rows():
+        obj = WorldObject(sprite, x, y, scale, scale, has_collision=bool(flags & DECOR_COLLISION))
+        (flat_objects if flags & DECOR_FLAT else objects).append(obj)
+
+    ground, decals = bake_chunk_ground(tile_data, flat_objects)
+
+    return Chunk((cx, cy), tile_data, objects, ground, decals, stored.tree_colliders, stored.rock_colliders)
+
+def generate_chunk(cx, cy, store_writes=None):
+    # With chunk_store enabled, stored data replaces world generation; freshly generated data is
+    # appended to store_writes as (cx, cy, StoredChunk) so the caller can write it back
+    stored = chunk_store.load(cx, cy) if chunk_store.ENABLED else None
+    if stored is None:
+        stored = _generate_chunk_data(cx, cy)
+        if chunk_store.ENABLED and store_writes is not None:
+            store_writes.append((cx, cy, stored))
+    return _build_chunk(cx, cy, stored)
+
+def _chunk_priority(dx, dy, heading):
+    # Distance from the center chunk, discounted for chunks in the direction of travel
+    hx, hy = heading
+    return math.hypot(dx, dy) - HEADING_BIAS * (dx * hx + dy * hy)
+
+def _update_loaded_chunks(center_chunk, heading=(0.0, 0.0)):
+    global _loaded_chunks
     cx, cy = center_chunk
 
     target_chunks = {
@@ -107,22 +299,63 @@ def _update_loaded_chunks(center_chunk):
         for dy in range( -2, 2)
     }
 
-    for chunk in target_chunks:
-        with _loaded_chunks_lock:
-            if chunk not in _loaded_chunks:
-                chunk_load_queue.put(chunk)
+    # Prefetch one ring ahead in the direction of travel (the window spans dx -2..2, dy -2..1)
+    sx = (heading[0] > 0.3) - (heading[0] < -0.3)
+    sy = (heading[1] > 0.3) - (heading[1] < -0.3)
+    ahead_x = cx + 3 * sx
+    ahead_y = cy + 2 if sy > 0 else cy - 3
+    if sx:
+        target_chunks |= {(ahead_x, cy + dy) for dy in range(-2, 2)}
+    if sy:
+        target_chunks |= {(cx + dx, ahead_y) for dx in range(-2, 3)}
+    if sx and sy:
+        target_chunks.add((ahead_x, ahead_y))
+
+    # Chunks that stay resident: the target window plus the hysteresis ring around it
+    h = CHUNK_HYSTERESIS
+    keep_chunks = target_chunks | {
+        (cx + dx, cy + dy)
+        for dx in range(-2 - h, 3 + h)
+        for dy in range(-2 - h, 2 + h)
+    }
 
-    with _loaded_chunks_lock:
-        for chunk in list(_loaded_chunks):
-            if chunk not in target_chunks:
-                del _loaded_chunks[chunk]
+    # Cancel queued requests that left the resident area, then restore missing chunks from the
+    # cache or (re)request them by priority. Chunks already queued or being generated are coalesced.
+    chunk_load_queue.retarget(keep_chunks)
+    loaded = _loaded_chunks
+    restored = []
+    for chunk in target_chunks:
+        if chunk in loaded:
+            continue
+        cached = _take_cached_chunk(chunk)
+        if cached is not None:
+            restored.append(cached)
+            _chunk_cache_stats["hits"] += 1
+        elif chunk_load_queue.request(chunk, priority=_chunk_priority(chunk[0] - cx, chunk[1] - cy, heading)) == QUEUED:
+            _chunk_cache_stats["misses"] += 1
+
+    # Swap in a new snapshot only when chunks are restored or leave the resident area
+    evicted = [c for coord, c in loaded.items() if coord not in keep_chunks]
+    if restored or evicted:
+        _acquire_chunks_lock_timed()
+        try:
+            published = {coord: c for coord, c in _loaded_chunks.items() if coord in keep_chunks}
+            published.update((c.coord, c) for c in restored)
+            _loaded_chunks = published
+        finally:
+            _loaded_chunks_lock.release()
+        for chunk in evicted:
+            _cache_chunk(chunk)
+    # Runs every update, not only on evictions: new requests and publishes change the headroom
+    _trim_chunk_cache()
 
 
 def get_render_data(camera_x, camera_y, player_x=None, player_y=None, screen_width=1260, screen_height=700):
-    global _last_active_chunk
+    global _last_active_chunk, _last_anchor, _heading
 
-    tile_layers = []
-    render_objects = []
+    tile_layers = []  # every visible chunk's ground, then every visible chunk's decals
+    decal_layers = []
+    render_objects = []  # one Y-sorted run of (anchor_y, obj) per visible chunk
 
     # Snap to top-left of the current chunk
     anchor_x = camera_x + (screen_width // 2)
@@ -134,20 +367,125 @@ def get_render_data(camera_x, camera_y, player_x=None, player_y=None, screen_wid
     )
     _last_active_chunk = center_chunk
 
-    _update_loaded_chunks(center_chunk)
-
-    with _loaded_chunks_lock:
-        for (cx, cy), (tiles, objects) in _loaded_chunks.items():
-            tile_layers.extend(tiles)
-            render_objects.extend(objects)
+    if _last_anchor is not None:
+        vx, vy = anchor_x - _last_anchor[0], anchor_y - _last_anchor[1]
+        speed = math.hypot(vx, vy)
+        _heading = (vx / speed, vy / speed) if speed > 0 else (0.0, 0.0)
+    _last_anchor = (anchor_x, anchor_y)
+    set_region_cache_center(int(anchor_x // TILE_SIZE), int(anchor_y // TILE_SIZE))
+
+    _update_loaded_chunks(center_chunk, _heading)
+
+    view = pygame.Rect(camera_x, camera_y, screen_width, screen_height)
+    drawn = culled = 0
+
+    # Lock-free: read the current immutable snapshot
+    for chunk in _loaded_chunks.values():
+        if not view.colliderect(chunk.bounds):
+            culled += 1 + len(chunk.objects)
+            continue
+        tile_layers.append(chunk.ground)
+        if chunk.decals is not None:
+            decal_layers.append(chunk.decals)
+        drawn += 1
+        run = []
+        for obj, rect in zip(chunk.objects, chunk.object_rects):
+            if view.colliderect(rect):
+                run.append((rect.bottom, obj))
+            else:
+                culled += 1
+        drawn += len(run)
+        if run:
+            render_objects.append(run)
+
+    tile_layers += decal_layers
+
+    _cull_stats["drawn"] = drawn
+    _cull_stats["culled"] = culled
 
     return tile_layers, render_objects, center_chunk
 
+def get_active_area():
+    # World-space rect covering the chunk window kept loaded around the last active chunk
+    if _last_active_chunk is None:
+        return None
+    cx, cy = _last_active_chunk
+    chunk_px = CHUNK_SIZE * TILE_SIZE
+    return pygame.Rect((cx - 2) * chunk_px, (cy - 2) * chunk_px, 5 * chunk_px, 4 * chunk_px)
+
+def get_chunk_queue_stats():
+    return chunk_load_queue.get_stats()
+
+def get_chunk_cache_stats():
+    return dict(_chunk_cache_stats, cached=len(_chunk_cache), resident=len(_loaded_chunks), resident_bytes=_resident_bytes()[0])
+
+def get_lock_stats():
+    return _lock_stats
+
+def get_cull_stats():
+    return _cull_stats
+
+# Collider lists derived from one _loaded_chunks snapshot: (snapshot, trees, rocks)
+_collider_cache = (None, [], [])
+
+def _get_colliders():
+    # Rebuilt only when the snapshot is swapped, so colliders always match the loaded chunk set
+    global _collider_cache
+    snapshot = _loaded_chunks
+    if _collider_cache[0] is not snapshot:
+        trees = [rect for chunk in snapshot.values() for rect in chunk.tree_colliders]
+        rocks = [rect for chunk in snapshot.values() for rect in chunk.rock_colliders]
+        _collider_cache = (snapshot, trees, rocks)
+    return _collider_cache
+
+# Broadphase for static colliders, kept in step with _loaded_chunks by _sync_static_hash (main thread only)
+_static_hash = SpatialHash(cell_size=TILE_SIZE)
+_static_hash_chunks = {}  # chunk coord -> Chunk whose colliders are in _static_hash
+_static_hash_snapshot = None
+
+def _sync_static_hash():
+    # Incrementally add/remove chunk colliders when the loaded snapshot changes
+    global _static_hash_snapshot
+    snapshot = _loaded_chunks
+    if snapshot is _static_hash_snapshot:
+        return
+    for coord, chunk in list(_static_hash_chunks.items()):
+        if snapshot.get(coord) is not chunk:
+            _static_hash.remove(coord)
+            del _static_hash_chunks[coord]
+    for coord, chunk in snapshot.items():
+        if coord not in _static_hash_chunks:
+            _static_hash.add(coord, chunk.tree_colliders + chunk.rock_colliders)
+            _static_hash_chunks[coord] = chunk
+    _static_hash_snapshot = snapshot
+
+def query_static_colliders(rect):
+    # Trees/rocks in the grid cells the rect overlaps (broadphase candidates)
+    _sync_static_hash()
+    return _static_hash.query_rect(rect)
+
+def query_static_point(x, y):
+    _sync_static_hash()
+    return _static_hash.query_point(x, y)
+
 def get_tree_colliders():
-    return _tree_colliders
+    return _get_colliders()[1]
 
 def get_rock_colliders():
-    return _rock_colliders
+    return _get_colliders()[2]
+
+def get_collider_stats():
+    # Debug counter: collider totals should track the number of loaded chunks, not session length
+    snapshot, trees, rocks = _get_colliders()
+    chunks = len(snapshot)
+    return {
+        "loaded_chunks": chunks,
+        "tree_colliders": len(trees),
+        "rock_colliders": len(rocks),
+        "per_chunk": (len(trees) + len(rocks)) / chunks if chunks else 0.0,
+        "hashed": _static_hash.get_stats()["rects"],
+    }
 
-# Start the chunk loader thread when the module is imported
-threading.Thread(target=_chunk_loader_thread, daemon=True).start()
+# Start the chunk loader workers when the module is imported
+for _ in range(CHUNK_WORKERS):
+    threading.Thread(target=_chunk_loader_thread, daemon=True).start()